@@ -0,0 +1,432 @@
+"""
+In-memory columnar delivery engine for the IPL Cricket Dashboard API.
+
+Every delivery is held as one row across a set of NumPy column arrays, so
+leaderboards and season trends are computed with vectorized kernels
+(bincount/reduceat) instead of Cypher aggregations. The engine is immutable
+once built: the API loads a new one for each data version and swaps the
+reference.
+
+An engine can be saved as a single analytics file (columns, per-player and
+per-season aggregates and materialized leaderboards) and
+reopened with mmap, so every uvicorn worker on a host shares one copy of the
+pages.
+"""
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Matches fetched per delivery query while loading
+LOAD_PAGE_MATCHES = 100
+
+# Phase codes derived from the 0-based over number
+PHASES = ("powerplay", "middle", "death")
+PHASE_OVER_BOUNDS = (6, 15)  # overs 0-5 powerplay, 6-14 middle, 15+ death
+
+# Column dtypes; player and team columns use -1 when the delivery has no linked node
+COLUMN_DTYPES = {
+    "match": np.int32,
+    "innings": np.int8,
+    "over": np.int8,
+    "ball": np.int8,
+    "batter": np.int32,
+    "bowler": np.int32,
+    "batting_team": np.int16,
+    "bowling_team": np.int16,
+    "runs": np.int16,
+    "extras": np.int16,
+    "wicket": np.int8,
+    "phase": np.int8,
+}
+
+# Leaderboard roles: the stat they are ranked by, and every stat kept per player
+ROLE_STATS = {
+    "batting": ("runs", "balls", "matches"),
+    "bowling": ("wickets", "balls", "runs_conceded", "matches"),
+}
+
+# Filters with a materialized top-K table per value ("all" is the unfiltered board)
+LEADERBOARD_DIMENSIONS = ("all", "season", "team", "venue", "phase")
+LEADERBOARD_TOP_K = 100
+
+# Analytics file layout: magic, header length, JSON header, then 64-byte aligned arrays
+FILE_MAGIC = b"BGAN"
+FILE_FORMAT_VERSION = 3
+FILE_ALIGNMENT = 64
+
+MATCHES_QUERY = """
+    MATCH (m:Match)
+    RETURN m.match_id as match_id, m.season as season, m.venue as venue,
+           [(m)-[:TEAM_INVOLVED]->(t:Team) | t.name] as teams
+    ORDER BY m.season, m.date, m.match_id
+"""
+
+DELIVERIES_QUERY = """
+    UNWIND $match_ids as match_id
+    MATCH (:Match {match_id: match_id})-[hi:HAS_INNINGS]->(i:Innings)-[:HAS_OVER]->(:Over)-[:HAS_DELIVERY]->(d:Delivery)
+    OPTIONAL MATCH (d)-[:FACED_BY]->(b:Player)
+    OPTIONAL MATCH (d)-[:BOWLED_BY]->(w:Player)
+    RETURN match_id, hi.innings_number, d.over_number, d.ball_in_over,
+           b.player_id, b.name, w.player_id, w.name, i.batting_team,
+           d.runs_batter, d.runs_extras, d.wicket_kind
+"""
+
+
+def player_slug(name: str) -> str:
+    """Slug the frontend uses for /api/players/{slug}/stats; keep in sync with the frontend's route helper"""
+    return re.sub(r'[^a-z0-9-]', '', re.sub(r'\s+', '-', name.lower()))
+
+
+class DeliveryEngine:
+    """Column arrays for every delivery of one data version, plus the dictionaries that decode them.
+
+    All state lives in `arrays`, so the same engine can be backed by freshly built
+    arrays or by read-only views into a memory-mapped analytics file.
+    """
+
+    def __init__(self, data_version: int, arrays: Dict[str, np.ndarray], dictionaries: Dict[str, list],
+                 source: str = "neo4j"):
+        self.data_version = data_version
+        self.arrays = arrays
+        self.dictionaries = dictionaries  # seasons, teams, venues, wicket_kinds (code 0 is "no wicket")
+        self.seasons = dictionaries["seasons"]
+        self.source = source
+        self.loaded_at = time.time()
+
+        self.columns = {name: arrays[name] for name in COLUMN_DTYPES}
+        self.match_season = arrays["match_season"]  # season code per match index
+        self.match_venue = arrays["match_venue"]  # venue code per match index
+        self.player_names = arrays["player_names"]
+        self.codes = {
+            "season": {season: code for code, season in enumerate(dictionaries["seasons"])},
+            "team": {team: code for code, team in enumerate(dictionaries["teams"])},
+            "venue": {venue: code for code, venue in enumerate(dictionaries["venues"])},
+            "phase": {phase: code for code, phase in enumerate(PHASES)},
+        }
+
+        if "season_codes" not in arrays:
+            arrays.update(self._derived_arrays())
+        self.season_codes = arrays["season_codes"]
+        self.season_starts = arrays["season_starts"]
+        self.batting = {stat: arrays[f"batting_{stat}"] for stat in ROLE_STATS["batting"]}
+        self.bowling = {stat: arrays[f"bowling_{stat}"] for stat in ROLE_STATS["bowling"]}
+
+    def _derived_arrays(self) -> Dict[str, np.ndarray]:
+        """Season boundaries, aggregates and leaderboards computed once per data version"""
+        c = self.columns
+        # Deliveries are ordered by match and matches by season, so each season is one contiguous run
+        delivery_season = self.match_season[c["match"]]
+        self.season_codes = np.unique(delivery_season)
+        self.season_starts = np.searchsorted(delivery_season, self.season_codes)
+
+        derived = {"season_codes": self.season_codes, "season_starts": self.season_starts}
+        for role in ROLE_STATS:
+            derived.update({f"{role}_{stat}": value for stat, value in self.totals(role).items()})
+        derived["season_runs"] = self._season_sums(np.where(c["batter"] >= 0, c["runs"], 0))
+        derived["season_wickets"] = self._season_sums((c["bowler"] >= 0) & (c["wicket"] > 0))
+
+        # Presorted top-K per filter value: rows are filter codes, columns are ranks (-1 pads short boards)
+        for role, stats in ROLE_STATS.items():
+            for dimension in LEADERBOARD_DIMENSIONS:
+                groups, n_groups = self._dimension_groups(role, dimension)
+                totals = self.grouped_totals(role, groups, n_groups)
+                ranked = np.argsort(-totals[stats[0]], axis=1, kind="stable")[:, :LEADERBOARD_TOP_K]
+                ranked_values = np.take_along_axis(totals[stats[0]], ranked, axis=1)
+                prefix = f"top_{role}_{dimension}"
+                derived[f"{prefix}_players"] = np.where(ranked_values > 0, ranked, -1).astype(np.int32)
+                for stat in stats:
+                    derived[f"{prefix}_{stat}"] = np.take_along_axis(totals[stat], ranked, axis=1)
+        return derived
+
+    # -------------------- loading --------------------
+
+    @classmethod
+    async def load(cls, driver, data_version: int, team_aliases: Optional[Dict[str, str]] = None) -> "DeliveryEngine":
+        """Read every delivery from Neo4j, a page of matches at a time, and build the columns off the event loop"""
+        started = time.time()
+
+        async def fetch(tx, cypher, params):
+            result = await tx.run(cypher, params)
+            return [record.values() async for record in result]
+
+        async with driver.session() as session:
+            matches = await session.execute_read(fetch, MATCHES_QUERY, {})
+            rows = []
+            for start in range(0, len(matches), LOAD_PAGE_MATCHES):
+                page = [m[0] for m in matches[start:start + LOAD_PAGE_MATCHES]]
+                rows.extend(await session.execute_read(fetch, DELIVERIES_QUERY, {"match_ids": page}))
+
+        engine = await asyncio.to_thread(cls.build, data_version, matches, rows, team_aliases)
+        logger.info(f"🧮 Analytics engine loaded {engine.size:,} deliveries from {len(matches):,} matches "
+                    f"in {time.time() - started:.1f}s (data version {data_version})")
+        return engine
+
+    @classmethod
+    def build(cls, data_version: int, matches: List[list], rows: List[list],
+              team_aliases: Optional[Dict[str, str]] = None) -> "DeliveryEngine":
+        """Dictionary-encode raw (match, delivery) rows into column arrays.
+
+        team_aliases maps old team names to the franchise's current one, so a
+        team code covers a franchise's whole history.
+        """
+        team_aliases = team_aliases or {}
+        season_index, venue_index, team_index = {}, {}, {}
+
+        def team_code(name):
+            if name is None:
+                return -1
+            name = team_aliases.get(name, name)
+            return team_index.setdefault(name, len(team_index))
+
+        match_index = {}
+        match_teams = []
+        match_season = np.empty(len(matches), dtype=np.int16)
+        match_venue = np.empty(len(matches), dtype=np.int16)
+        for idx, (match_id, season, venue, teams) in enumerate(matches):
+            match_index[match_id] = idx
+            match_season[idx] = season_index.setdefault(season, len(season_index))
+            match_venue[idx] = venue_index.setdefault(venue, len(venue_index))
+            match_teams.append(teams or [])
+
+        player_index = {}
+        player_names = []
+        wicket_index = {None: 0}
+
+        def player_code(player_id, name):
+            if player_id is None:
+                return -1
+            code = player_index.get(player_id)
+            if code is None:
+                code = player_index[player_id] = len(player_names)
+                player_names.append(name)
+            return code
+
+        n = len(rows)
+        raw = {name: np.empty(n, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+        for i, (match_id, innings, over, ball, batter_id, batter, bowler_id, bowler, batting_team,
+                runs, extras, wicket_kind) in enumerate(rows):
+            match = match_index[match_id]
+            bowling_team = next((team for team in match_teams[match] if team != batting_team), None)
+            raw["match"][i] = match
+            raw["innings"][i] = innings or 0
+            raw["over"][i] = over or 0
+            raw["ball"][i] = ball or 0
+            raw["batter"][i] = player_code(batter_id, batter)
+            raw["bowler"][i] = player_code(bowler_id, bowler)
+            raw["batting_team"][i] = team_code(batting_team)
+            raw["bowling_team"][i] = team_code(bowling_team)
+            raw["runs"][i] = runs or 0
+            raw["extras"][i] = extras or 0
+            raw["wicket"][i] = wicket_index.setdefault(wicket_kind, len(wicket_index))
+        raw["phase"][:] = np.searchsorted(PHASE_OVER_BOUNDS, raw["over"], side="right")
+
+        order = np.lexsort((raw["ball"], raw["over"], raw["innings"], raw["match"]))
+        arrays = {name: column[order] for name, column in raw.items()}
+        arrays["match_season"] = match_season
+        arrays["match_venue"] = match_venue
+        arrays["player_names"] = np.array(player_names, dtype=str)
+
+        dictionaries = {
+            "seasons": list(season_index),
+            "teams": list(team_index),
+            "venues": list(venue_index),
+            "wicket_kinds": list(wicket_index),
+        }
+        return cls(data_version, arrays, dictionaries)
+
+    # -------------------- analytics file --------------------
+
+    def save(self, path: str):
+        """Write every array to one analytics file, atomically replacing any file at path"""
+        header = {
+            "format_version": FILE_FORMAT_VERSION,
+            "data_version": self.data_version,
+            "dictionaries": self.dictionaries,
+            "arrays": {},
+        }
+        offset = 0
+        for name, array in self.arrays.items():
+            header["arrays"][name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+            offset += -(-array.nbytes // FILE_ALIGNMENT) * FILE_ALIGNMENT
+        header_bytes = json.dumps(header).encode()
+        data_start = -(-(len(FILE_MAGIC) + 4 + len(header_bytes)) // FILE_ALIGNMENT) * FILE_ALIGNMENT
+
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(FILE_MAGIC + struct.pack(">I", len(header_bytes)) + header_bytes)
+            for name, array in self.arrays.items():
+                f.seek(data_start + header["arrays"][name]["offset"])
+                f.write(np.ascontiguousarray(array).tobytes())
+            f.truncate(data_start + offset)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path: str) -> "DeliveryEngine":
+        """Map an analytics file read-only; the arrays are views into pages shared with other processes"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mapped[:len(FILE_MAGIC)] != FILE_MAGIC:
+            raise ValueError(f"{path} is not an analytics file")
+        header_length = struct.unpack(">I", mapped[len(FILE_MAGIC):len(FILE_MAGIC) + 4])[0]
+        header_end = len(FILE_MAGIC) + 4 + header_length
+        header = json.loads(mapped[len(FILE_MAGIC) + 4:header_end])
+        if header["format_version"] != FILE_FORMAT_VERSION:
+            raise ValueError(f"{path} has analytics format {header['format_version']}, expected {FILE_FORMAT_VERSION}")
+        data_start = -(-header_end // FILE_ALIGNMENT) * FILE_ALIGNMENT
+
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"]))
+            arrays[name] = np.frombuffer(mapped, dtype=dtype, count=count,
+                                         offset=data_start + spec["offset"]).reshape(spec["shape"])
+        return cls(header["data_version"], arrays, header["dictionaries"], source="mmap")
+
+    # -------------------- kernels --------------------
+
+    @property
+    def size(self) -> int:
+        return len(self.columns["match"])
+
+    def _dimension_groups(self, role: str, dimension: str) -> tuple:
+        """Per-delivery group code for a leaderboard dimension, and the number of groups"""
+        c = self.columns
+        if dimension == "all":
+            return np.zeros(self.size, dtype=np.int32), 1
+        if dimension == "season":
+            return self.match_season[c["match"]], len(self.seasons)
+        if dimension == "venue":
+            return self.match_venue[c["match"]], len(self.dictionaries["venues"])
+        if dimension == "team":
+            return c["batting_team" if role == "batting" else "bowling_team"], len(self.dictionaries["teams"])
+        return c["phase"], len(PHASES)
+
+    def grouped_totals(self, role: str, groups: np.ndarray, n_groups: int) -> Dict[str, np.ndarray]:
+        """Per-group, per-player totals as (n_groups, n_players) arrays; groups of -1 are left out.
+
+        Same definitions as BATTING_STATS/BOWLING_STATS: every ball faced or bowled counts,
+        and a bowler is credited with every wicket that falls on his delivery.
+        """
+        c = self.columns
+        players = c["batter" if role == "batting" else "bowler"]
+        n_players = len(self.player_names)
+        size = n_groups * n_players
+        mask = (players >= 0) & (groups >= 0)
+        cell = groups[mask].astype(np.int64) * n_players + players[mask]
+
+        def count(weights=None):
+            return np.bincount(cell, weights=weights, minlength=size).astype(np.int64).reshape(n_groups, n_players)
+
+        # Distinct (group, match, player) triples give matches played per group
+        matches = np.zeros(size, dtype=np.int64)
+        if n_players:
+            triples = np.unique((groups[mask].astype(np.int64) * len(self.match_season)
+                                 + c["match"][mask]) * n_players + players[mask])
+            groups_of = triples // (len(self.match_season) * n_players)
+            matches = np.bincount(groups_of * n_players + triples % n_players, minlength=size)
+        totals = {"balls": count(), "matches": matches.astype(np.int64).reshape(n_groups, n_players)}
+        if role == "batting":
+            totals["runs"] = count(c["runs"][mask])
+        else:
+            totals["wickets"] = count(c["wicket"][mask] > 0)
+            totals["runs_conceded"] = count(c["runs"][mask] + c["extras"][mask])
+        return totals
+
+    def totals(self, role: str, mask: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Per-player totals over the deliveries selected by mask (all of them by default)"""
+        groups = np.zeros(self.size, dtype=np.int32) if mask is None else np.where(mask, 0, -1)
+        return {stat: values[0] for stat, values in self.grouped_totals(role, groups, 1).items()}
+
+    def _season_sums(self, values: np.ndarray) -> np.ndarray:
+        if not self.size:
+            return np.zeros(0, dtype=np.int64)
+        return np.add.reduceat(values.astype(np.int64), self.season_starts)
+
+    # -------------------- queries --------------------
+
+    def _rows(self, role: str, players: np.ndarray, stats: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+        rows = []
+        for i, p in enumerate(players):
+            row = {"name": str(self.player_names[p]), "matches": int(stats["matches"][i])}
+            balls = int(stats["balls"][i])
+            if role == "batting":
+                row["runs"] = int(stats["runs"][i])
+                row["strike_rate"] = round(row["runs"] * 100.0 / balls, 2) if balls else 0
+            else:
+                row["wickets"] = int(stats["wickets"][i])
+                row["economy"] = round(int(stats["runs_conceded"][i]) * 6.0 / balls, 2) if balls else 0
+            rows.append(row)
+        return rows
+
+    def leaderboard(self, role: str, limit: int = 20, season: Optional[str] = None, team: Optional[str] = None,
+                    venue: Optional[str] = None, phase: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Top players by runs (batting) or wickets (bowling) under any combination of filters.
+
+        No filter or a single one, within LEADERBOARD_TOP_K, is read from the presorted
+        table in O(limit); other combinations take one vectorized pass over the deliveries.
+        A value that never occurs (e.g. an unknown venue) gives an empty board.
+        """
+        filters = {}
+        for dimension, value in (("season", season), ("team", team), ("venue", venue), ("phase", phase)):
+            if value is None:
+                continue
+            code = self.codes[dimension].get(value)
+            if code is None:
+                return []
+            filters[dimension] = code
+        primary = ROLE_STATS[role][0]
+
+        if len(filters) <= 1 and limit <= LEADERBOARD_TOP_K:
+            dimension, code = next(iter(filters.items()), ("all", 0))
+            prefix = f"top_{role}_{dimension}"
+            players = self.arrays[f"{prefix}_players"][code, :limit]
+            players = players[:np.count_nonzero(players >= 0)]
+            stats = {stat: self.arrays[f"{prefix}_{stat}"][code, :len(players)] for stat in ROLE_STATS[role]}
+            return self._rows(role, players, stats)
+
+        mask = np.ones(self.size, dtype=bool)
+        for dimension, code in filters.items():
+            groups, _ = self._dimension_groups(role, dimension)
+            mask &= groups == code
+        totals = self.totals(role, mask)
+        ranked = np.argsort(-totals[primary], kind="stable")[:limit]
+        ranked = ranked[totals[primary][ranked] > 0]
+        return self._rows(role, ranked, {stat: values[ranked] for stat, values in totals.items()})
+
+    def top_batsmen(self, limit: int = 20, **filters) -> List[Dict[str, Any]]:
+        return self.leaderboard("batting", limit, **filters)
+
+    def top_bowlers(self, limit: int = 20, **filters) -> List[Dict[str, Any]]:
+        return self.leaderboard("bowling", limit, **filters)
+
+    def runs_by_season(self) -> List[Dict[str, Any]]:
+        return [{"season": self.seasons[s], "total_runs": int(total)}
+                for s, total in zip(self.season_codes, self.arrays["season_runs"])]
+
+    def wickets_by_season(self) -> List[Dict[str, Any]]:
+        return [{"season": self.seasons[s], "total_wickets": int(total)}
+                for s, total in zip(self.season_codes, self.arrays["season_wickets"])]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "data_version": self.data_version,
+            "source": self.source,
+            "deliveries": self.size,
+            "matches": len(self.match_season),
+            "players": len(self.player_names),
+            "bytes": sum(array.nbytes for array in self.arrays.values()),
+            "loaded_at": self.loaded_at,
+        }
@@ -7,6 +7,9 @@ Execute these in Neo4j Browser or using cypher-shell for best performance.
 """
 
 # ==================== INDEXES FOR PERFORMANCE ====================
+# The importer applies these as schema migration 3 (see SCHEMA_MIGRATIONS in
+# data_importer.py); Team.name, Match.season and Match.date are already
+# covered by the importer's constraints and indexes.
 
 # Primary indexes on frequently queried fields
 CREATE INDEX player_name_index IF NOT EXISTS FOR (p:Player) ON (p.name);
@@ -21,14 +24,18 @@ CREATE INDEX match_season_winner IF NOT EXISTS FOR (m:Match) ON (m.season, m.win
 CREATE INDEX match_venue_season IF NOT EXISTS FOR (m:Match) ON (m.venue, m.season);
 
 # Delivery indexes for ball-by-ball analysis
-CREATE INDEX delivery_over_ball IF NOT EXISTS FOR (d:Delivery) ON (d.over, d.ball);
+CREATE INDEX delivery_over_ball IF NOT EXISTS FOR (d:Delivery) ON (d.over_number, d.ball_in_over);
 CREATE INDEX delivery_runs_index IF NOT EXISTS FOR (d:Delivery) ON (d.runs_total);
 
+# Fulltext indexes for name search
+CREATE FULLTEXT INDEX player_name_fulltext IF NOT EXISTS FOR (p:Player) ON EACH [p.name];
+CREATE FULLTEXT INDEX team_venue_name_fulltext IF NOT EXISTS FOR (n:Team|Venue) ON EACH [n.name];
+
 # ==================== QUERY OPTIMIZATION PATTERNS ====================
 
 # Instead of: MATCH (p:Player) WHERE p.name CONTAINS 'virat'
 # Use: MATCH (p:Player) WHERE toLower(p.name) CONTAINS toLower('virat')
-# Better: Create fulltext index and use db.index.fulltext.queryNodes()
+# Better: CALL db.index.fulltext.queryNodes('player_name_fulltext', 'virat')
 
 # For top batsmen - optimized version:
 MATCH (p:Player)-[bs:BATTING_STATS]->(m:Match)
@@ -1,10 +1,20 @@
+import argparse
+import csv
+import hashlib
 import json
 import os
+import queue
+import re
+import shutil
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Set
 from datetime import datetime
 from neo4j import GraphDatabase
+import numpy as np
 import logging
 from dotenv import load_dotenv
 
@@ -23,6 +33,102 @@ logger = logging.getLogger(__name__)
 # Ensure output is unbuffered
 sys.stdout = sys.stderr if sys.stdout.isatty() else sys.stdout
 
+# Schema version the importer and API expect; keep in sync with backend_api.SCHEMA_VERSION
+SCHEMA_VERSION = 6
+
+# Over and Innings totals of one innings `i`, from its Delivery nodes, with the definitions of
+# build_match_payload. Used as a CALL {} subquery body, so it imports `i` and returns nothing.
+SCORE_TOTALS_SUBQUERY = """
+    WITH i
+    MATCH (i)-[:HAS_OVER]->(o:Over)
+    OPTIONAL MATCH (o)-[:HAS_DELIVERY]->(d:Delivery)
+    WITH i, o,
+         sum(coalesce(d.runs_total, 0)) as runs,
+         count(CASE WHEN d.is_wicket AND coalesce(d.wicket_kind, '') <> 'retired hurt' THEN 1 END) as wickets,
+         sum(coalesce(d.runs_extras, 0)) as extras,
+         count(CASE WHEN d.runs_batter = 4 AND NOT coalesce(d.is_non_boundary, false) THEN 1 END) as fours,
+         count(CASE WHEN d.runs_batter = 6 AND NOT coalesce(d.is_non_boundary, false) THEN 1 END) as sixes,
+         count(CASE WHEN d IS NOT NULL AND NOT coalesce(d.extras_type, '') IN ['wides', 'noballs'] THEN 1 END) as legal_balls
+    ORDER BY o.over_number
+    WITH i, collect({over: o, runs: runs, wickets: wickets, extras: extras, fours: fours, sixes: sixes,
+                     legal_balls: legal_balls}) as overs
+    WITH i, overs,
+         reduce(total = 0, t IN overs | total + t.runs) as runs,
+         reduce(total = 0, t IN overs | total + t.legal_balls) as legal_balls
+    SET i.total_runs = runs,
+        i.total_wickets = reduce(total = 0, t IN overs | total + t.wickets),
+        i.extras = reduce(total = 0, t IN overs | total + t.extras),
+        i.fours = reduce(total = 0, t IN overs | total + t.fours),
+        i.sixes = reduce(total = 0, t IN overs | total + t.sixes),
+        i.legal_balls = legal_balls,
+        i.overs_bowled = legal_balls / 6 + (legal_balls % 6) / 10.0,
+        i.run_rate = CASE WHEN legal_balls > 0 THEN round(runs * 6.0 / legal_balls, 2) ELSE 0.0 END
+    WITH overs
+    UNWIND range(0, size(overs) - 1) as idx
+    WITH overs[idx] as t,
+         reduce(acc = [0, 0], prior IN overs[0..idx + 1] | [acc[0] + prior.runs, acc[1] + prior.wickets]) as cumulative
+    WITH t.over as o, t, cumulative
+    SET o.runs = t.runs,
+        o.wickets = t.wickets,
+        o.extras = t.extras,
+        o.fours = t.fours,
+        o.sixes = t.sixes,
+        o.legal_balls = t.legal_balls,
+        o.cumulative_runs = cumulative[0],
+        o.cumulative_wickets = cumulative[1]
+"""
+
+# Versioned schema migrations: (version, description, statements)
+SCHEMA_MIGRATIONS = [
+    (1, "Core uniqueness constraints and lookup indexes", [
+        "CREATE CONSTRAINT match_id IF NOT EXISTS FOR (m:Match) REQUIRE m.match_id IS UNIQUE",
+        "CREATE CONSTRAINT player_id IF NOT EXISTS FOR (p:Player) REQUIRE p.player_id IS UNIQUE",
+        "CREATE CONSTRAINT team_name IF NOT EXISTS FOR (t:Team) REQUIRE t.name IS UNIQUE",
+        "CREATE CONSTRAINT venue_name IF NOT EXISTS FOR (v:Venue) REQUIRE v.name IS UNIQUE",
+        "CREATE CONSTRAINT season_year IF NOT EXISTS FOR (s:Season) REQUIRE s.year IS UNIQUE",
+        "CREATE CONSTRAINT official_name IF NOT EXISTS FOR (o:Official) REQUIRE o.name IS UNIQUE",
+        "CREATE CONSTRAINT schema_migration_version IF NOT EXISTS FOR (m:SchemaMigration) REQUIRE m.version IS UNIQUE",
+        "CREATE INDEX delivery_match IF NOT EXISTS FOR (d:Delivery) ON (d.match_id)",
+        "CREATE INDEX delivery_innings IF NOT EXISTS FOR (d:Delivery) ON (d.innings_number)",
+        "CREATE INDEX innings_match IF NOT EXISTS FOR (i:Innings) ON (i.match_id)",
+        "CREATE INDEX over_match IF NOT EXISTS FOR (o:Over) ON (o.match_id)",
+        "CREATE INDEX match_season IF NOT EXISTS FOR (m:Match) ON (m.season)",
+        "CREATE INDEX match_date IF NOT EXISTS FOR (m:Match) ON (m.date)",
+        "CREATE INDEX partnership_match IF NOT EXISTS FOR ()-[p:PARTNERSHIP]-() ON (p.match_id)",
+    ]),
+    (2, "Uniqueness constraints for Innings, Over and Delivery ids", [
+        "CREATE CONSTRAINT innings_id IF NOT EXISTS FOR (i:Innings) REQUIRE i.innings_id IS UNIQUE",
+        "CREATE CONSTRAINT over_id IF NOT EXISTS FOR (o:Over) REQUIRE o.over_id IS UNIQUE",
+        "CREATE CONSTRAINT delivery_id IF NOT EXISTS FOR (d:Delivery) REQUIRE d.delivery_id IS UNIQUE",
+    ]),
+    (3, "Query indexes from backend/neo4j_optimization.cypher", [
+        "CREATE INDEX player_name_index IF NOT EXISTS FOR (p:Player) ON (p.name)",
+        "CREATE INDEX match_venue_index IF NOT EXISTS FOR (m:Match) ON (m.venue)",
+        "CREATE INDEX match_winner_index IF NOT EXISTS FOR (m:Match) ON (m.winner)",
+        "CREATE INDEX match_season_winner IF NOT EXISTS FOR (m:Match) ON (m.season, m.winner)",
+        "CREATE INDEX match_venue_season IF NOT EXISTS FOR (m:Match) ON (m.venue, m.season)",
+        "CREATE INDEX delivery_over_ball IF NOT EXISTS FOR (d:Delivery) ON (d.over_number, d.ball_in_over)",
+        "CREATE INDEX delivery_runs_index IF NOT EXISTS FOR (d:Delivery) ON (d.runs_total)",
+        "CREATE FULLTEXT INDEX player_name_fulltext IF NOT EXISTS FOR (p:Player) ON EACH [p.name]",
+        "CREATE FULLTEXT INDEX team_venue_name_fulltext IF NOT EXISTS FOR (n:Team|Venue) ON EACH [n.name]",
+    ]),
+    (4, "Partnership leaderboard index", [
+        "CREATE INDEX partnership_runs IF NOT EXISTS FOR ()-[p:PARTNERSHIP]-() ON (p.runs)",
+    ]),
+    (5, "Player profile documents", [
+        "CREATE CONSTRAINT player_profile_id IF NOT EXISTS FOR (pp:PlayerProfile) REQUIRE pp.player_id IS UNIQUE",
+        "CREATE INDEX player_profile_slug IF NOT EXISTS FOR (pp:PlayerProfile) ON (pp.slug)",
+    ]),
+    # Matches imported before totals were stored are never rewritten by the manifest, so fill them in place
+    (6, "Backfill Over and Innings totals from deliveries", [
+        f"""
+        MATCH (i:Innings) WHERE i.legal_balls IS NULL
+        CALL {{ {SCORE_TOTALS_SUBQUERY} }} IN TRANSACTIONS OF 100 ROWS
+        """,
+    ]),
+]
+
+
 class IPLNeo4jImporter:
     """
     Imports IPL JSON match data into Neo4j graph database with ball-by-ball granularity.
@@ -56,18 +162,67 @@ class IPLNeo4jImporter:
         'innings.overs.deliveries.runs.non_boundary'
     }
     
-    def __init__(self, uri: str, username: str, password: str, json_folder: str):
+    # Normalize split-year seasons to the year the tournament was played
+    SEASON_MAPPING = {
+        "2007/08": "2008",
+        "2009/10": "2010",
+        "2020/21": "2020"
+    }
+
+    # Delivery -> Player relationship types written by the bulk writer
+    PLAYER_LINK_STATEMENTS = {
+        'BOWLED_BY': "MERGE (d)-[:BOWLED_BY]->(p)",
+        'FACED_BY': "MERGE (d)-[:FACED_BY]->(p)",
+        'NON_STRIKER': "MERGE (d)-[:NON_STRIKER]->(p)",
+        'DISMISSED': "MERGE (d)-[:DISMISSED {kind: r.kind}]->(p)",
+        'CAUGHT_BY': "MERGE (d)-[:CAUGHT_BY {substitute: r.substitute}]->(p)",
+        'STUMPED_BY': "MERGE (d)-[:STUMPED_BY {substitute: r.substitute}]->(p)",
+        'RUN_OUT_BY': "MERGE (d)-[:RUN_OUT_BY {substitute: r.substitute}]->(p)",
+    }
+
+    # Fielder relationship type by wicket kind
+    FIELDER_LINK_TYPES = {
+        'caught': 'CAUGHT_BY',
+        'stumped': 'STUMPED_BY',
+        'run out': 'RUN_OUT_BY',
+    }
+
+    # Matches per transaction when computing derived stats with CALL {} IN TRANSACTIONS
+    STATS_BATCH_SIZE = 50
+
+    # Players per read/write when rebuilding profile documents, and matches kept as recent form
+    PROFILE_BATCH_SIZE = 500
+    PROFILE_RECENT_FORM = 10
+
+    # Running totals kept per Over and per Innings while walking deliveries
+    SCORE_TOTAL_KEYS = ('runs', 'wickets', 'extras', 'fours', 'sixes', 'legal_balls')
+
+    # Wicket kind -> FIELDING_STATS counter credited to each listed fielder
+    FIELDING_STAT_KEYS = {
+        'caught': 'catches',
+        'stumped': 'stumpings',
+        'run out': 'run_outs',
+    }
+
+    def __init__(self, uri: str, username: str, password: str, json_folder: str,
+                 bulk_write: bool = True, snapshot_dir: str = None):
         """
         Initialize the importer.
-        
+
         Args:
             uri: Neo4j connection URI (e.g., 'bolt://localhost:7687')
             username: Neo4j username
             password: Neo4j password
             json_folder: Path to folder containing IPL JSON files
+            bulk_write: Write each match in a single transaction with batched
+                UNWIND statements instead of one statement per over/delivery
+            snapshot_dir: Directory for the columnar snapshot written after each
+                data version bump (None disables it)
         """
         self.driver = GraphDatabase.driver(uri, auth=(username, password))
         self.json_folder = Path(json_folder)
+        self.bulk_write = bulk_write
+        self.snapshot_dir = snapshot_dir
         self.skipped_fields_log = "skipped_json_fields.txt"
         self.skipped_fields: Set[str] = set()
         
@@ -77,76 +232,157 @@ class IPLNeo4jImporter:
         
     def create_constraints_and_indexes(self):
         """Create database constraints and indexes for performance."""
+        self.apply_schema_migrations()
+    
+    def get_schema_version(self, session) -> int:
+        """Return the highest schema migration version recorded in the graph (0 if none)."""
+        record = session.run("""
+            MATCH (m:SchemaMigration)
+            RETURN coalesce(max(m.version), 0) as version
+        """).single()
+        return record['version'] if record else 0
+    
+    def apply_schema_migrations(self) -> int:
+        """
+        Apply pending SCHEMA_MIGRATIONS in version order.
+
+        Every statement is idempotent (IF NOT EXISTS), and a version is only
+        recorded as a (:SchemaMigration) node once all of its statements have
+        succeeded, so a failed migration is retried on the next run.
+
+        Returns:
+            The schema version of the database after migrating
+        """
         with self.driver.session() as session:
-            constraints_indexes = [
-                # Constraints for uniqueness
-                "CREATE CONSTRAINT match_id IF NOT EXISTS FOR (m:Match) REQUIRE m.match_id IS UNIQUE",
-                "CREATE CONSTRAINT player_id IF NOT EXISTS FOR (p:Player) REQUIRE p.player_id IS UNIQUE",
-                "CREATE CONSTRAINT team_name IF NOT EXISTS FOR (t:Team) REQUIRE t.name IS UNIQUE",
-                "CREATE CONSTRAINT venue_name IF NOT EXISTS FOR (v:Venue) REQUIRE v.name IS UNIQUE",
-                "CREATE CONSTRAINT season_year IF NOT EXISTS FOR (s:Season) REQUIRE s.year IS UNIQUE",
-                "CREATE CONSTRAINT official_name IF NOT EXISTS FOR (o:Official) REQUIRE o.name IS UNIQUE",
-                
-                # Indexes for performance
-                "CREATE INDEX delivery_match IF NOT EXISTS FOR (d:Delivery) ON (d.match_id)",
-                "CREATE INDEX delivery_innings IF NOT EXISTS FOR (d:Delivery) ON (d.innings_number)",
-                "CREATE INDEX innings_match IF NOT EXISTS FOR (i:Innings) ON (i.match_id)",
-                "CREATE INDEX over_match IF NOT EXISTS FOR (o:Over) ON (o.match_id)",
-                "CREATE INDEX match_season IF NOT EXISTS FOR (m:Match) ON (m.season)",
-                "CREATE INDEX match_date IF NOT EXISTS FOR (m:Match) ON (m.date)",
-                "CREATE INDEX partnership_match IF NOT EXISTS FOR ()-[p:PARTNERSHIP]-() ON (p.match_id)",
-            ]
+            current_version = self.get_schema_version(session)
+            logger.info(f"Schema version: {current_version} (latest: {SCHEMA_VERSION})")
             
-            for statement in constraints_indexes:
+            for version, description, statements in SCHEMA_MIGRATIONS:
+                if version <= current_version:
+                    continue
+                logger.info(f"Applying schema migration {version}: {description}")
                 try:
-                    session.run(statement)
-                    logger.info(f"Executed: {statement[:60]}...")
+                    # Schema changes cannot share a transaction with data writes,
+                    # so each statement runs in its own auto-commit transaction
+                    for statement in statements:
+                        session.run(statement).consume()
+                        logger.info(f"Executed: {' '.join(statement.split())[:60]}...")
                 except Exception as e:
-                    logger.warning(f"Constraint/Index may already exist: {e}")
+                    logger.error(f"Schema migration {version} failed: {e}")
+                    break
+                
+                session.run("""
+                    MERGE (m:SchemaMigration {version: $version})
+                    SET m.description = $description, m.applied_at = datetime()
+                """, version=version, description=description).consume()
+                current_version = version
+            
+            return current_version
     
-    def track_json_path(self, obj: Any, prefix: str = ""):
+    def bump_data_version(self, imported_count: int, match_ids: List[str] = None) -> int:
         """
-        Recursively track all JSON paths to identify unmapped fields.
+        Increment the (:DataVersion) counter after a run that changed match data.
+
+        The API polls this node and folds the version into its cache keys, so
+        cached responses from before the import stop being served. A columnar
+        snapshot is then written for the new version (see write_snapshot).
+
+        Args:
+            imported_count: Matches imported by the run
+            match_ids: Matches written by the run, so the snapshot only rebuilds
+                their seasons ([] when only derived stats changed; None rebuilds
+                every season)
+
+        Returns:
+            The new data version
+        """
+        with self.driver.session() as session:
+            record = session.run("""
+                MERGE (v:DataVersion {id: 'current'})
+                SET v.version = coalesce(v.version, 0) + 1,
+                    v.updated_at = datetime(),
+                    v.last_import_count = $imported_count
+                RETURN v.version as version
+            """, imported_count=imported_count).single()
+        logger.info(f"Data version bumped to {record['version']}")
+        self.write_snapshot(record['version'], match_ids)
+        return record['version']
+    
+    def write_snapshot(self, data_version: int, match_ids: List[str] = None, parse_workers: int = None):
+        """Write the columnar snapshot for data_version; a failure is logged, not raised."""
+        if not self.snapshot_dir:
+            return
+        try:
+            ColumnarSnapshotExporter(self.json_folder, self.snapshot_dir).export(
+                data_version, self.get_sorted_json_files(), parse_workers, match_ids
+            )
+        except Exception as e:
+            logger.error(f"❌ Columnar snapshot for data version {data_version} failed: {e}")
+    
+    @classmethod
+    def find_unmapped_paths(cls, obj: Any, prefix: str = "", found: Set[str] = None) -> Set[str]:
+        """
+        Recursively collect all leaf JSON paths not covered by MAPPED_PATHS.
         """
+        if found is None:
+            found = set()
         if isinstance(obj, dict):
             for key, value in obj.items():
                 path = f"{prefix}.{key}" if prefix else key
-                if path not in self.MAPPED_PATHS:
+                if path not in cls.MAPPED_PATHS:
                     # Check if any child path is mapped
-                    is_parent_mapped = any(mp.startswith(path + ".") for mp in self.MAPPED_PATHS)
+                    is_parent_mapped = any(mp.startswith(path + ".") for mp in cls.MAPPED_PATHS)
                     if not is_parent_mapped and not isinstance(value, (dict, list)):
-                        self.skipped_fields.add(path)
-                self.track_json_path(value, path)
+                        found.add(path)
+                cls.find_unmapped_paths(value, path, found)
         elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                self.track_json_path(item, prefix)
+            for item in obj:
+                cls.find_unmapped_paths(item, prefix, found)
+        return found
+    
+    def track_json_path(self, obj: Any, prefix: str = ""):
+        """
+        Recursively track all JSON paths to identify unmapped fields.
+        """
+        self.find_unmapped_paths(obj, prefix, self.skipped_fields)
     
     def log_skipped_fields(self, match_id: str, data: Dict):
         """Log any JSON fields not mapped in our model."""
         self.track_json_path(data)
+        self.write_skipped_fields(match_id, self.skipped_fields)
         
-        if self.skipped_fields:
-            with open(self.skipped_fields_log, 'a') as f:
-                timestamp = datetime.now().isoformat()
-                f.write(f"\n{'='*80}\n")
-                f.write(f"Timestamp: {timestamp}\n")
-                f.write(f"Match ID: {match_id}\n")
-                f.write(f"Skipped Fields:\n")
-                for field in sorted(self.skipped_fields):
-                    f.write(f"  - {field}\n")
-            
-            # Clear for next match
-            self.skipped_fields.clear()
+        # Clear for next match
+        self.skipped_fields.clear()
+    
+    def write_skipped_fields(self, match_id: str, skipped_fields: Set[str]):
+        """Append a match's unmapped JSON fields to the skipped fields log."""
+        if not skipped_fields:
+            return
+        
+        with open(self.skipped_fields_log, 'a') as f:
+            timestamp = datetime.now().isoformat()
+            f.write(f"\n{'='*80}\n")
+            f.write(f"Timestamp: {timestamp}\n")
+            f.write(f"Match ID: {match_id}\n")
+            f.write(f"Skipped Fields:\n")
+            for field in sorted(skipped_fields):
+                f.write(f"  - {field}\n")
     
     def get_sorted_json_files(self) -> List[Path]:
         """
         Sort JSON files by season and match date based on README.txt pattern.
         Returns files in chronological order from Season 1, Match 1 onwards.
         """
+        return self.sort_match_files(self.json_folder)
+    
+    @staticmethod
+    def sort_match_files(json_folder: Path) -> List[Path]:
+        """Return the match files of json_folder in chronological order."""
+        json_folder = Path(json_folder)
         json_files = []
         
         # Parse README to get chronological order
-        readme_path = self.json_folder / "README.txt"
+        readme_path = json_folder / "README.txt"
         if readme_path.exists():
             with open(readme_path, 'r') as f:
                 for line in f:
@@ -154,12 +390,12 @@ class IPLNeo4jImporter:
                         parts = line.strip().split(' - ')
                         if len(parts) >= 5:
                             match_id = parts[4].strip()
-                            json_file = self.json_folder / f"{match_id}.json"
+                            json_file = json_folder / f"{match_id}.json"
                             if json_file.exists():
                                 json_files.append(json_file)
         else:
             # Fallback: sort by filename (match_id)
-            json_files = sorted(self.json_folder.glob("*.json"))
+            json_files = sorted(json_folder.glob("*.json"))
         
         # Reverse to get chronological order (oldest first)
         json_files.reverse()
@@ -167,24 +403,19 @@ class IPLNeo4jImporter:
         logger.info(f"Found {len(json_files)} JSON files to import")
         return json_files
     
+    @classmethod
+    def normalize_season(cls, raw_season: Any) -> str:
+        """Normalize a cricsheet season (e.g. '2007/08') to a single year string."""
+        season = str(raw_season)
+        return cls.SEASON_MAPPING.get(season, season)
+
     def import_match(self, session, match_data: Dict, match_id: str):
         """Import a single match with all its ball-by-ball data."""
         
         info = match_data.get('info', {})
         
         # 1. Create/Merge Season
-        # 1. Create/Merge Season
-        raw_season = info.get('season', 'Unknown')
-        
-        # Normalize season
-        season_mapping = {
-            "2007/08": "2008",
-            "2009/10": "2010",
-            "2020/21": "2020"
-        }
-        season = str(raw_season)
-        if season in season_mapping:
-            season = season_mapping[season]
+        season = self.normalize_season(info.get('season', 'Unknown'))
 
         session.run("""
             MERGE (s:Season {year: $year})
@@ -388,8 +619,6 @@ class IPLNeo4jImporter:
                     i.match_id = $match_id,
                     i.innings_number = $innings_number,
                     i.batting_team = $batting_team,
-                    i.total_runs = $total_runs,
-                    i.total_wickets = $total_wickets,
                     i.target_runs = $target_runs,
                     i.target_overs = $target_overs,
                     i.powerplay_from = $pp_from,
@@ -398,8 +627,6 @@ class IPLNeo4jImporter:
                 ON MATCH SET i.match_id = $match_id,
                     i.innings_number = $innings_number,
                     i.batting_team = $batting_team,
-                    i.total_runs = $total_runs,
-                    i.total_wickets = $total_wickets,
                     i.target_runs = $target_runs,
                     i.target_overs = $target_overs,
                     i.powerplay_from = $pp_from,
@@ -410,8 +637,6 @@ class IPLNeo4jImporter:
                 match_id=match_id,
                 innings_number=innings_idx,
                 batting_team=batting_team,
-                total_runs=0,
-                total_wickets=0,
                 target_runs=target.get('runs'),
                 target_overs=target.get('overs'),
                 pp_from=pp_from,
@@ -946,103 +1171,813 @@ class IPLNeo4jImporter:
                          player_in=player_in, reason=reason, team=team,
                          over_number=over_number, delivery_number=delivery_number)
     
-    def compute_and_store_aggregated_stats(self, session, match_id: str):
+    @classmethod
+    def build_match_payload(cls, match_data: Dict, match_id: str,
+                            source_hash: str = None) -> Dict[str, Any]:
         """
-        Compute aggregated batting and bowling statistics from ball-by-ball data.
-        Creates BATTING_STATS and BOWLING_STATS relationships.
+        Build every node and relationship row for a match in memory.
+
+        The payload mirrors what import_match/import_innings_data write, grouped
+        so that write_match_payload can send each kind of row with one UNWIND.
+        source_hash (see hash_match_file) is stored on the Match node as the
+        import manifest entry for the file.
+
+        Per-player batting, bowling and fielding figures are accumulated in the
+        same pass over the deliveries, with the definitions used by
+        compute_and_store_aggregated_stats.
+        """
+        info = match_data.get('info', {})
+        season = cls.normalize_season(info.get('season', 'Unknown'))
+        venue_name = info.get('venue', 'Unknown')
+        city = info.get('city', 'Unknown')
+        teams = info.get('teams', [])
+        registry = info.get('registry', {}).get('people', {})
+        officials = info.get('officials', {})
+        outcome = info.get('outcome', {})
+        outcome_by = outcome.get('by', {})
+        toss = info.get('toss', {})
+        event = info.get('event', {})
+
+        payload = {
+            'match_id': match_id,
+            'season': season,
+            'venue': venue_name,
+            'city': city,
+            'team_type': info.get('team_type', 'club'),
+            'teams': [{'name': team_name, 'role': 'team1' if i == 0 else 'team2'}
+                      for i, team_name in enumerate(teams)],
+            'winner': outcome.get('winner'),
+            'toss_winner': toss.get('winner'),
+            'players': [{'name': name, 'id': pid} for name, pid in registry.items()],
+            'officials': [{'name': name, 'role': role}
+                          for role, names in officials.items()
+                          for name in names],
+            'player_of_match': [registry[pom] for pom in info.get('player_of_match', [])
+                                if registry.get(pom)],
+            'squad': [{'team': team_name, 'player_id': registry[player_name]}
+                      for team_name, player_names in info.get('players', {}).items()
+                      for player_name in player_names
+                      if registry.get(player_name)],
+            'match': {
+                'date': info.get('dates', ['Unknown'])[0],
+                'season': season,
+                'venue': venue_name,
+                'city': city,
+                'match_number': event.get('match_number'),
+                'match_type': info.get('match_type', 'T20'),
+                'gender': info.get('gender', 'male'),
+                'winner': outcome.get('winner'),
+                'outcome_type': 'runs' if 'runs' in outcome_by else 'wickets' if 'wickets' in outcome_by else None,
+                'outcome_margin': outcome_by.get('runs') or outcome_by.get('wickets'),
+                'toss_winner': toss.get('winner'),
+                'toss_decision': toss.get('decision'),
+                'balls_per_over': info.get('balls_per_over', 6),
+                'overs': info.get('overs', 20),
+                'source_hash': source_hash
+            },
+            'innings': [],
+            'overs': [],
+            'deliveries': [],
+            'player_links': {rel_type: [] for rel_type in cls.PLAYER_LINK_STATEMENTS},
+            'partnerships': [],
+        }
+        player_links = payload['player_links']
+        batting: Dict[str, Dict[str, Any]] = {}
+        bowling: Dict[str, Dict[str, Any]] = {}
+        fielding: Dict[str, Dict[str, int]] = {}
+
+        for innings_idx, innings_data in enumerate(match_data.get('innings', []), 1):
+            innings_id = f"{match_id}_innings_{innings_idx}"
+            target = innings_data.get('target', {})
+            powerplays = innings_data.get('powerplays', [])
+            first_pp = powerplays[0] if powerplays else {}
+
+            # Neo4j properties cannot hold lists of maps, so powerplay phases
+            # are stored as parallel arrays
+            payload['innings'].append({
+                'innings_id': innings_id,
+                'innings_number': innings_idx,
+                'batting_team': innings_data.get('team'),
+                'props': {
+                    'match_id': match_id,
+                    'innings_number': innings_idx,
+                    'batting_team': innings_data.get('team'),
+                    'total_runs': 0,
+                    'total_wickets': 0,
+                    'target_runs': target.get('runs'),
+                    'target_overs': target.get('overs'),
+                    'powerplay_from': first_pp.get('from'),
+                    'powerplay_to': first_pp.get('to'),
+                    'powerplay_types': [pp.get('type', 'mandatory') for pp in powerplays],
+                    'powerplay_from_overs': [pp.get('from') for pp in powerplays],
+                    'powerplay_to_overs': [pp.get('to') for pp in powerplays],
+                }
+            })
+
+            delivery_counter = 0
+            partnership_balls = []
+            innings_totals = dict.fromkeys(cls.SCORE_TOTAL_KEYS, 0)
+            for over_data in innings_data.get('overs', []):
+                over_number = over_data.get('over')
+                over_id = f"{innings_id}_over_{over_number}"
+                over_totals = dict.fromkeys(cls.SCORE_TOTAL_KEYS, 0)
+                over_props = {
+                    'innings_id': innings_id,
+                    'match_id': match_id,
+                    'over_number': over_number
+                }
+                payload['overs'].append({
+                    'over_id': over_id,
+                    'innings_id': innings_id,
+                    'over_number': over_number,
+                    'props': over_props
+                })
+
+                for ball_idx, delivery in enumerate(over_data.get('deliveries', []), 1):
+                    delivery_counter += 1
+                    delivery_id = f"{over_id}_ball_{ball_idx}"
+
+                    runs = delivery.get('runs', {})
+                    extras = delivery.get('extras', {})
+                    wickets = delivery.get('wickets', [])
+                    review = delivery.get('review', {})
+                    wicket_kind = wickets[0].get('kind') if wickets else None
+
+                    payload['deliveries'].append({
+                        'delivery_id': delivery_id,
+                        'over_id': over_id,
+                        'ball_in_over': ball_idx,
+                        'props': {
+                            'match_id': match_id,
+                            'innings_id': innings_id,
+                            'over_id': over_id,
+                            'delivery_number': delivery_counter,
+                            'over_number': over_number,
+                            'ball_in_over': ball_idx,
+                            'runs_batter': runs.get('batter', 0),
+                            'runs_extras': runs.get('extras', 0),
+                            'runs_total': runs.get('total', 0),
+                            'extras_type': list(extras.keys())[0] if extras else None,
+                            'is_wicket': len(wickets) > 0,
+                            'wicket_kind': wicket_kind,
+                            'is_boundary': runs.get('batter', 0) == 4,
+                            'is_six': runs.get('batter', 0) == 6,
+                            'is_non_boundary': runs.get('non_boundary', False),
+                            'review_by': review.get('by'),
+                            'review_umpire': review.get('umpire'),
+                            'review_decision': review.get('decision'),
+                            'review_type': review.get('type'),
+                            'umpires_call': review.get('umpires_call')
+                        }
+                    })
+
+                    for rel_type, role in (('BOWLED_BY', 'bowler'),
+                                           ('FACED_BY', 'batter'),
+                                           ('NON_STRIKER', 'non_striker')):
+                        player_id = registry.get(delivery.get(role))
+                        if player_id:
+                            player_links[rel_type].append({'delivery_id': delivery_id, 'player_id': player_id})
+
+                    runs_batter = runs.get('batter', 0)
+                    runs_total = runs.get('total', 0)
+                    batter_id = registry.get(delivery.get('batter'))
+                    bowler_id = registry.get(delivery.get('bowler'))
+                    player_out_id = registry.get(wickets[0].get('player_out')) if wickets else None
+
+                    if batter_id:
+                        bat = batting.setdefault(batter_id, {
+                            'runs': 0, 'balls': 0, 'fours': 0, 'sixes': 0, 'dots': 0, 'dismissal_type': None
+                        })
+                        bat['runs'] += runs_batter
+                        bat['balls'] += 1
+                        bat['fours'] += runs_batter == 4
+                        bat['sixes'] += runs_batter == 6
+                        bat['dots'] += runs_batter == 0 and runs.get('extras', 0) == 0
+                        if player_out_id == batter_id and wicket_kind:
+                            bat['dismissal_type'] = max(bat['dismissal_type'] or wicket_kind, wicket_kind)
+
+                    if bowler_id:
+                        bowl = bowling.setdefault(bowler_id, {
+                            'over_ids': set(), 'balls': 0, 'runs_conceded': 0, 'wickets': 0,
+                            'dots': 0, 'fours_conceded': 0, 'sixes_conceded': 0
+                        })
+                        bowl['over_ids'].add(over_id)
+                        bowl['balls'] += 1
+                        bowl['runs_conceded'] += runs_total
+                        bowl['wickets'] += len(wickets) > 0
+                        bowl['dots'] += runs_total == 0
+                        bowl['fours_conceded'] += runs_batter == 4
+                        bowl['sixes_conceded'] += runs_batter == 6
+
+                    # Retirements end a partnership but are not wickets on the scorecard
+                    is_dismissal = wicket_kind is not None and wicket_kind != 'retired hurt'
+                    over_totals['runs'] += runs_total
+                    over_totals['wickets'] += is_dismissal
+                    over_totals['extras'] += runs.get('extras', 0)
+                    over_totals['fours'] += runs_batter == 4 and not runs.get('non_boundary', False)
+                    over_totals['sixes'] += runs_batter == 6 and not runs.get('non_boundary', False)
+                    over_totals['legal_balls'] += 'wides' not in extras and 'noballs' not in extras
+
+                    partnership_balls.append({
+                        'batter_id': batter_id,
+                        'non_striker_id': registry.get(delivery.get('non_striker')),
+                        'over_number': over_number,
+                        'runs_total': runs_total,
+                        'is_wide': 'wides' in extras,
+                        'wicket_kind': wicket_kind
+                    })
+
+                    if wicket_kind == 'caught and bowled' and bowler_id:
+                        fielding.setdefault(bowler_id, {'catches': 0, 'stumpings': 0, 'run_outs': 0})['catches'] += 1
+
+                    if not wickets:
+                        continue
+                    if not player_out_id:
+                        continue
+                    player_links['DISMISSED'].append({
+                        'delivery_id': delivery_id,
+                        'player_id': player_out_id,
+                        'kind': wicket_kind
+                    })
+
+                    fielder_rel = cls.FIELDER_LINK_TYPES.get(wicket_kind)
+                    if not fielder_rel:
+                        continue
+                    for fielder_info in wickets[0].get('fielders', []):
+                        fielder_id = registry.get(fielder_info.get('name'))
+                        if fielder_id:
+                            player_links[fielder_rel].append({
+                                'delivery_id': delivery_id,
+                                'player_id': fielder_id,
+                                'substitute': fielder_info.get('substitute', False)
+                            })
+                            fielding.setdefault(fielder_id, {'catches': 0, 'stumpings': 0, 'run_outs': 0})[
+                                cls.FIELDING_STAT_KEYS[wicket_kind]] += 1
+
+                for key, value in over_totals.items():
+                    innings_totals[key] += value
+                over_props.update(over_totals)
+                over_props['cumulative_runs'] = innings_totals['runs']
+                over_props['cumulative_wickets'] = innings_totals['wickets']
+
+            legal_balls = innings_totals['legal_balls']
+            payload['innings'][-1]['props'].update({
+                'total_runs': innings_totals['runs'],
+                'total_wickets': innings_totals['wickets'],
+                'extras': innings_totals['extras'],
+                'fours': innings_totals['fours'],
+                'sixes': innings_totals['sixes'],
+                'legal_balls': legal_balls,
+                'overs_bowled': legal_balls // 6 + (legal_balls % 6) / 10.0,
+                'run_rate': round(innings_totals['runs'] * 6 / legal_balls, 2) if legal_balls else 0.0
+            })
+            payload['partnerships'].extend(cls.segment_partnerships(match_id, innings_id, partnership_balls))
+
+        payload['batting_stats'] = [{
+            'player_id': player_id,
+            'props': {
+                **bat,
+                'strike_rate': bat['runs'] / bat['balls'] * 100,
+                'out': bat['dismissal_type'] is not None
+            }
+        } for player_id, bat in batting.items()]
+        payload['bowling_stats'] = [{
+            'player_id': player_id,
+            'props': {
+                'overs': len(bowl['over_ids']) + (bowl['balls'] % 6) / 10.0,
+                'balls': bowl['balls'],
+                'runs_conceded': bowl['runs_conceded'],
+                'wickets': bowl['wickets'],
+                'economy': bowl['runs_conceded'] / bowl['balls'] * 6,
+                'dots': bowl['dots'],
+                'fours_conceded': bowl['fours_conceded'],
+                'sixes_conceded': bowl['sixes_conceded'],
+                'strike_rate': bowl['balls'] / bowl['wickets'] if bowl['wickets'] else None
+            }
+        } for player_id, bowl in bowling.items()]
+        payload['fielding_stats'] = [{'player_id': player_id, 'props': field}
+                                     for player_id, field in fielding.items()]
+
+        return payload
+
+    @staticmethod
+    def segment_partnerships(match_id: str, innings_id: str, balls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Split one innings' deliveries into partnerships in a single pass.
+
+        balls are in delivery order, each with batter_id, non_striker_id,
+        over_number, runs_total, is_wide and wicket_kind. A partnership ends on
+        a wicket delivery, when the pair at the crease changes (e.g. a
+        retirement) or at the end of the innings. Pairs are unordered: each
+        partnership is one row keyed by the lower player id first. balls counts
+        deliveries faced, i.e. excluding wides; wicket_ended is false for
+        'retired hurt', which is not a dismissal.
+        """
+        partnerships = []
+        current = None
+
+        def close(wicket_ended: bool):
+            current['props']['wicket_ended'] = wicket_ended
+            partnerships.append(current)
+
+        for ball in balls:
+            if not (ball['batter_id'] and ball['non_striker_id']):
+                continue
+            pair = tuple(sorted((ball['batter_id'], ball['non_striker_id'])))
+            if current and current['pair'] != pair:
+                close(False)
+                current = None
+            if current is None:
+                current = {
+                    'pair': pair,
+                    'player1_id': pair[0],
+                    'player2_id': pair[1],
+                    'props': {
+                        'match_id': match_id,
+                        'innings_id': innings_id,
+                        'partnership_number': len(partnerships) + 1,
+                        'runs': 0,
+                        'balls': 0,
+                        'from_over': ball['over_number'],
+                        'to_over': ball['over_number'],
+                    }
+                }
+            props = current['props']
+            props['runs'] += ball['runs_total']
+            props['balls'] += not ball['is_wide']
+            props['to_over'] = ball['over_number']
+            if ball['wicket_kind']:
+                close(ball['wicket_kind'] != 'retired hurt')
+                current = None
+
+        if current:
+            close(False)
+
+        for partnership in partnerships:
+            del partnership['pair']
+        return partnerships
+
+    @classmethod
+    def write_partnerships(cls, tx, partnerships: List[Dict[str, Any]]):
+        """MERGE one PARTNERSHIP relationship per partnership, from the lower to the higher player id."""
+        if not partnerships:
+            return
+        tx.run("""
+            UNWIND $rows as row
+            MATCH (a:Player {player_id: row.player1_id})
+            MATCH (b:Player {player_id: row.player2_id})
+            MERGE (a)-[ps:PARTNERSHIP {
+                match_id: row.props.match_id,
+                innings_id: row.props.innings_id,
+                partnership_number: row.props.partnership_number
+            }]->(b)
+            SET ps += row.props
+        """, rows=sorted(partnerships, key=lambda r: (r['player1_id'], r['player2_id'])))
+
+    @classmethod
+    def write_match_payload(cls, tx, payload: Dict[str, Any]):
+        """
+        Write a payload built by build_match_payload inside a managed transaction.
+
+        Sends one UNWIND per row kind, so a match costs a fixed handful of
+        round trips regardless of how many overs and deliveries it has.
+        """
+        match_id = payload['match_id']
+        season = payload['season']
+
+        tx.run("""
+            MERGE (s:Season {year: $season})
+            MERGE (v:Venue {name: $venue})
+            ON CREATE SET v.city = $city
+            MERGE (m:Match {match_id: $match_id})
+            SET m += $match
+            MERGE (m)-[:PLAYED_IN]->(s)
+            MERGE (m)-[:HELD_AT]->(v)
+        """, match_id=match_id, season=season, venue=payload['venue'],
+             city=payload['city'], match=payload['match'])
+
+        if payload['teams']:
+            tx.run("""
+                MATCH (m:Match {match_id: $match_id})
+                UNWIND $teams as team
+                MERGE (t:Team {name: team.name})
+                ON CREATE SET t.team_type = $team_type
+                MERGE (m)-[:TEAM_INVOLVED {role: team.role}]->(t)
+                FOREACH (_ IN CASE WHEN team.name = $winner THEN [1] ELSE [] END |
+                    MERGE (m)-[:WON_BY]->(t))
+                FOREACH (_ IN CASE WHEN team.name = $toss_winner THEN [1] ELSE [] END |
+                    MERGE (m)-[:TOSS_WON_BY]->(t))
+            """, match_id=match_id, teams=payload['teams'], team_type=payload['team_type'],
+                 winner=payload['winner'], toss_winner=payload['toss_winner'])
+
+        if payload['players']:
+            tx.run("""
+                UNWIND $players as player
+                MERGE (p:Player {player_id: player.id})
+                ON CREATE SET p.name = player.name
+            """, players=payload['players'])
+
+        if payload['officials']:
+            tx.run("""
+                MATCH (m:Match {match_id: $match_id})
+                UNWIND $officials as official
+                MERGE (o:Official {name: official.name})
+                ON CREATE SET o.role = official.role
+                MERGE (m)-[:OFFICIATED_BY {role: official.role}]->(o)
+            """, match_id=match_id, officials=payload['officials'])
+
+        if payload['player_of_match']:
+            tx.run("""
+                MATCH (m:Match {match_id: $match_id})
+                UNWIND $player_ids as player_id
+                MATCH (p:Player {player_id: player_id})
+                MERGE (m)-[:PLAYER_OF_MATCH]->(p)
+            """, match_id=match_id, player_ids=payload['player_of_match'])
+
+        if payload['squad']:
+            tx.run("""
+                UNWIND $squad as s
+                MATCH (t:Team {name: s.team})
+                MATCH (p:Player {player_id: s.player_id})
+                MERGE (t)-[:SELECTED_PLAYER {match_id: $match_id, season: $season}]->(p)
+            """, squad=payload['squad'], match_id=match_id, season=season)
+
+        if payload['innings']:
+            tx.run("""
+                MATCH (m:Match {match_id: $match_id})
+                UNWIND $innings as inn
+                MERGE (i:Innings {innings_id: inn.innings_id})
+                SET i += inn.props
+                MERGE (m)-[:HAS_INNINGS {innings_number: inn.innings_number}]->(i)
+                WITH i, inn
+                MATCH (t:Team {name: inn.batting_team})
+                MERGE (i)-[:BATTING_TEAM]->(t)
+            """, match_id=match_id, innings=payload['innings'])
+
+        if payload['overs']:
+            tx.run("""
+                UNWIND $overs as ov
+                MATCH (i:Innings {innings_id: ov.innings_id})
+                MERGE (o:Over {over_id: ov.over_id})
+                SET o += ov.props
+                MERGE (i)-[:HAS_OVER {over_number: ov.over_number}]->(o)
+            """, overs=payload['overs'])
+
+        if payload['deliveries']:
+            tx.run("""
+                UNWIND $deliveries as d
+                MATCH (o:Over {over_id: d.over_id})
+                MERGE (del:Delivery {delivery_id: d.delivery_id})
+                SET del += d.props
+                MERGE (o)-[:HAS_DELIVERY {position: d.ball_in_over}]->(del)
+            """, deliveries=payload['deliveries'])
+
+        for rel_type in ('BATTING_STATS', 'BOWLING_STATS', 'FIELDING_STATS'):
+            rows = payload[rel_type.lower()]
+            if rows:
+                tx.run(f"""
+                    MATCH (m:Match {{match_id: $match_id}})
+                    UNWIND $rows as row
+                    MATCH (p:Player {{player_id: row.player_id}})
+                    MERGE (p)-[s:{rel_type}]->(m)
+                    SET s += row.props
+                """, match_id=match_id, rows=sorted(rows, key=lambda r: r['player_id']))
+
+        cls.write_partnerships(tx, payload['partnerships'])
+
+        for rel_type, merge_clause in cls.PLAYER_LINK_STATEMENTS.items():
+            rows = payload['player_links'].get(rel_type)
+            if rows:
+                # Touch players in a stable order to keep lock acquisition consistent
+                rows = sorted(rows, key=lambda r: r['player_id'])
+                tx.run(f"""
+                    UNWIND $relationships as r
+                    MATCH (d:Delivery {{delivery_id: r.delivery_id}})
+                    MATCH (p:Player {{player_id: r.player_id}})
+                    {merge_clause}
+                """, relationships=rows)
+
+    def write_matches(self, tx, batch: List[tuple]):
+        """Write a batch of (match_id, match_data, source_hash) items inside one transaction."""
+        if self.bulk_write:
+            self.write_payloads(tx, [(match_id, self.build_match_payload(match_data, match_id, source_hash))
+                                     for match_id, match_data, source_hash in batch])
+            return
+        self.delete_match_data(tx, [match_id for match_id, _, _ in batch])
+        for match_id, match_data, source_hash in batch:
+            self.import_match(tx, match_data, match_id)
+            tx.run("""
+                MATCH (m:Match {match_id: $match_id})
+                SET m.source_hash = $source_hash
+            """, match_id=match_id, source_hash=source_hash)
+
+    @classmethod
+    def write_payloads(cls, tx, batch: List[tuple]):
+        """
+        Write a batch of (match_id, payload) pairs inside one transaction.
+
+        Any existing data for the batch's matches is deleted first, so a
+        changed match file is replaced atomically and a retried batch never
+        duplicates rows.
+        """
+        cls.delete_match_data(tx, [match_id for match_id, _ in batch])
+        cls.write_shared_entities(tx, [payload for _, payload in batch])
+        for _, payload in batch:
+            cls.write_match_payload(tx, payload)
+
+    @staticmethod
+    def delete_match_data(tx, match_ids: List[str]):
+        """
+        Delete the Match, Innings, Over and Delivery nodes of the given matches.
+
+        Relationships go with them, including derived BATTING_STATS and
+        BOWLING_STATS; PARTNERSHIP and SELECTED_PLAYER relationships between
+        shared nodes are removed by match_id. Shared Player, Team, Venue,
+        Season and Official nodes are kept.
+        """
+        tx.run("""
+            MATCH (m:Match)-[:TEAM_INVOLVED]->(:Team)-[r:SELECTED_PLAYER]->(:Player)
+            WHERE m.match_id IN $match_ids AND r.match_id = m.match_id
+            DELETE r
+        """, match_ids=match_ids)
+        tx.run("""
+            MATCH ()-[r:PARTNERSHIP]->()
+            WHERE r.match_id IN $match_ids
+            DELETE r
+        """, match_ids=match_ids)
+        for label in ('Delivery', 'Over', 'Innings', 'Match'):
+            tx.run(f"""
+                MATCH (n:{label})
+                WHERE n.match_id IN $match_ids
+                DETACH DELETE n
+            """, match_ids=match_ids)
+
+    @staticmethod
+    def write_shared_entities(tx, payloads: List[Dict[str, Any]]):
+        """
+        MERGE the Season, Venue, Team, Official and Player nodes of a batch up front.
+
+        Nodes are merged label by label in sorted key order, so concurrent
+        writers creating the same shared entities take their locks in one
+        global order. The relationships written afterwards by
+        write_match_payload still lock Team and Player nodes in payload order,
+        so two batches can deadlock there; the driver's retry of the whole
+        transaction (execute_write) is what recovers from that.
+
+        Properties set on create keep the first value seen in the batch, as
+        the per-match ON CREATE SET did before.
+        """
+        seasons = sorted({p['season'] for p in payloads})
+        venues, teams, officials, players = {}, {}, {}, {}
+        for p in payloads:
+            venues.setdefault(p['venue'], p['city'])
+            for t in p['teams']:
+                teams.setdefault(t['name'], p['team_type'])
+            for o in p['officials']:
+                officials.setdefault(o['name'], o['role'])
+            for pl in p['players']:
+                players.setdefault(pl['id'], pl['name'])
+
+        tx.run("""
+            UNWIND $seasons as year
+            MERGE (s:Season {year: year})
+        """, seasons=seasons)
+        tx.run("""
+            UNWIND $venues as venue
+            MERGE (v:Venue {name: venue.name})
+            ON CREATE SET v.city = venue.city
+        """, venues=[{'name': name, 'city': venues[name]} for name in sorted(venues)])
+        if teams:
+            tx.run("""
+                UNWIND $teams as team
+                MERGE (t:Team {name: team.name})
+                ON CREATE SET t.team_type = team.team_type
+            """, teams=[{'name': name, 'team_type': teams[name]} for name in sorted(teams)])
+        if officials:
+            tx.run("""
+                UNWIND $officials as official
+                MERGE (o:Official {name: official.name})
+                ON CREATE SET o.role = official.role
+            """, officials=[{'name': name, 'role': officials[name]} for name in sorted(officials)])
+        if players:
+            tx.run("""
+                UNWIND $players as player
+                MERGE (p:Player {player_id: player.id})
+                ON CREATE SET p.name = player.name
+            """, players=[{'id': pid, 'name': players[pid]} for pid in sorted(players)])
+
+    def import_match_batch(self, session, batch: List[tuple], write_func=None) -> tuple[int, int]:
+        """
+        Commit a batch of matches in a single write transaction.
+
+        Batch items are (match_id, match_data, source_hash) tuples written by
+        write_matches, or (match_id, payload) pairs when write_func is
+        write_payloads.
+
+        The driver retries transient failures (deadlocks, leader switches) of the
+        whole transaction. If the batch still fails it is rolled back as a unit
+        and its matches are retried one transaction each, so a single bad match
+        cannot leave partial data behind or sink its neighbours.
+
+        Returns:
+            Tuple of (matches committed, matches failed)
+        """
+        if not batch:
+            return 0, 0
+        
+        write_func = write_func or self.write_matches
+        match_ids = [item[0] for item in batch]
+        try:
+            session.execute_write(write_func, batch)
+            logger.info(f"  ✓ Committed {len(batch)} matches ({match_ids[0]} .. {match_ids[-1]})")
+            return len(batch), 0
+        except Exception as e:
+            logger.warning(f"Batch {match_ids[0]} .. {match_ids[-1]} rolled back: {str(e)}")
+            logger.info("Retrying batch one match per transaction...")
+        
+        committed = 0
+        failed = 0
+        for item in batch:
+            try:
+                session.execute_write(write_func, [item])
+                committed += 1
+            except Exception as e:
+                failed += 1
+                self.log_import_error(f"{item[0]}.json", e)
+        return committed, failed
+
+    def log_import_error(self, file_name: str, error: Exception):
+        """Log a failed match import to the console and import_errors.log."""
+        logger.error(f"Failed to import {file_name}: {str(error)}")
+        with open("import_errors.log", 'a') as f:
+            f.write(f"{datetime.now().isoformat()} - {file_name}: {str(error)}\n")
+
+    def import_match_bulk(self, session, match_data: Dict, match_id: str):
+        """Import a single match in one managed write transaction."""
+        payload = self.build_match_payload(match_data, match_id)
+        session.execute_write(self.write_payloads, [(match_id, payload)])
+
+    def compute_and_store_aggregated_stats(self, session, match_ids: List[str]):
+        """
+        Compute aggregated batting, bowling and fielding statistics from ball-by-ball data.
+        Creates BATTING_STATS, BOWLING_STATS and FIELDING_STATS relationships.
+
+        Set-based over all match_ids, committed STATS_BATCH_SIZE matches per
+        transaction with CALL {} IN TRANSACTIONS (needs an auto-commit session.run).
         """
         
         # Batting Statistics
         session.run("""
-            MATCH (m:Match {match_id: $match_id})
-            MATCH (d:Delivery {match_id: $match_id})-[:FACED_BY]->(p:Player)
-            WITH m, p, 
-                 SUM(d.runs_batter) as runs,
-                 COUNT(d) as balls,
-                 SUM(CASE WHEN d.runs_batter = 4 THEN 1 ELSE 0 END) as fours,
-                 SUM(CASE WHEN d.runs_batter = 6 THEN 1 ELSE 0 END) as sixes,
-                 SUM(CASE WHEN d.runs_batter = 0 AND d.runs_extras = 0 THEN 1 ELSE 0 END) as dots,
-                 MAX(CASE WHEN d.is_wicket AND (d)-[:DISMISSED]->(p) THEN d.wicket_kind ELSE null END) as dismissal_type
-            WHERE balls > 0
-            MERGE (p)-[bs:BATTING_STATS]->(m)
-            SET bs.runs = runs,
-                bs.balls = balls,
-                bs.fours = fours,
-                bs.sixes = sixes,
-                bs.dots = dots,
-                bs.strike_rate = CASE WHEN balls > 0 THEN toFloat(runs) / balls * 100 ELSE 0 END,
-                bs.dismissal_type = dismissal_type,
-                bs.out = (dismissal_type IS NOT NULL)
-        """, match_id=match_id)
+            UNWIND $match_ids as match_id
+            CALL {
+                WITH match_id
+                MATCH (m:Match {match_id: match_id})
+                MATCH (d:Delivery {match_id: match_id})-[:FACED_BY]->(p:Player)
+                WITH m, p, 
+                     SUM(d.runs_batter) as runs,
+                     COUNT(d) as balls,
+                     SUM(CASE WHEN d.runs_batter = 4 THEN 1 ELSE 0 END) as fours,
+                     SUM(CASE WHEN d.runs_batter = 6 THEN 1 ELSE 0 END) as sixes,
+                     SUM(CASE WHEN d.runs_batter = 0 AND d.runs_extras = 0 THEN 1 ELSE 0 END) as dots,
+                     MAX(CASE WHEN d.is_wicket AND (d)-[:DISMISSED]->(p) THEN d.wicket_kind ELSE null END) as dismissal_type
+                WHERE balls > 0
+                MERGE (p)-[bs:BATTING_STATS]->(m)
+                SET bs.runs = runs,
+                    bs.balls = balls,
+                    bs.fours = fours,
+                    bs.sixes = sixes,
+                    bs.dots = dots,
+                    bs.strike_rate = CASE WHEN balls > 0 THEN toFloat(runs) / balls * 100 ELSE 0 END,
+                    bs.dismissal_type = dismissal_type,
+                    bs.out = (dismissal_type IS NOT NULL)
+            } IN TRANSACTIONS OF $batch_size ROWS
+        """, match_ids=match_ids, batch_size=self.STATS_BATCH_SIZE).consume()
         
         # Bowling Statistics
         session.run("""
-            MATCH (m:Match {match_id: $match_id})
-            MATCH (d:Delivery {match_id: $match_id})-[:BOWLED_BY]->(p:Player)
-            WITH m, p,
-                 COUNT(DISTINCT d.over_id) as overs_bowled,
-                 COUNT(d) as balls,
-                 SUM(d.runs_total) as runs_conceded,
-                 SUM(CASE WHEN d.is_wicket THEN 1 ELSE 0 END) as wickets,
-                 SUM(CASE WHEN d.runs_total = 0 THEN 1 ELSE 0 END) as dots,
-                 SUM(CASE WHEN d.runs_batter = 4 THEN 1 ELSE 0 END) as fours_conceded,
-                 SUM(CASE WHEN d.runs_batter = 6 THEN 1 ELSE 0 END) as sixes_conceded
-            WHERE balls > 0
-            MERGE (p)-[bw:BOWLING_STATS]->(m)
-            SET bw.overs = toFloat(overs_bowled) + toFloat(balls % 6) / 10.0,
-                bw.balls = balls,
-                bw.runs_conceded = runs_conceded,
-                bw.wickets = wickets,
-                bw.economy = CASE WHEN balls > 0 THEN toFloat(runs_conceded) / balls * 6 ELSE 0 END,
-                bw.dots = dots,
-                bw.fours_conceded = fours_conceded,
-                bw.sixes_conceded = sixes_conceded,
-                bw.strike_rate = CASE WHEN wickets > 0 THEN toFloat(balls) / wickets ELSE null END
-        """, match_id=match_id)
+            UNWIND $match_ids as match_id
+            CALL {
+                WITH match_id
+                MATCH (m:Match {match_id: match_id})
+                MATCH (d:Delivery {match_id: match_id})-[:BOWLED_BY]->(p:Player)
+                WITH m, p,
+                     COUNT(DISTINCT d.over_id) as overs_bowled,
+                     COUNT(d) as balls,
+                     SUM(d.runs_total) as runs_conceded,
+                     SUM(CASE WHEN d.is_wicket THEN 1 ELSE 0 END) as wickets,
+                     SUM(CASE WHEN d.runs_total = 0 THEN 1 ELSE 0 END) as dots,
+                     SUM(CASE WHEN d.runs_batter = 4 THEN 1 ELSE 0 END) as fours_conceded,
+                     SUM(CASE WHEN d.runs_batter = 6 THEN 1 ELSE 0 END) as sixes_conceded
+                WHERE balls > 0
+                MERGE (p)-[bw:BOWLING_STATS]->(m)
+                SET bw.overs = toFloat(overs_bowled) + toFloat(balls % 6) / 10.0,
+                    bw.balls = balls,
+                    bw.runs_conceded = runs_conceded,
+                    bw.wickets = wickets,
+                    bw.economy = CASE WHEN balls > 0 THEN toFloat(runs_conceded) / balls * 6 ELSE 0 END,
+                    bw.dots = dots,
+                    bw.fours_conceded = fours_conceded,
+                    bw.sixes_conceded = sixes_conceded,
+                    bw.strike_rate = CASE WHEN wickets > 0 THEN toFloat(balls) / wickets ELSE null END
+            } IN TRANSACTIONS OF $batch_size ROWS
+        """, match_ids=match_ids, batch_size=self.STATS_BATCH_SIZE).consume()
+        
+        # Fielding Statistics: one credit per fielder link, and caught and bowled is a catch for the bowler
+        session.run("""
+            UNWIND $match_ids as match_id
+            CALL {
+                WITH match_id
+                MATCH (m:Match {match_id: match_id})
+                MATCH (d:Delivery {match_id: match_id})
+                WHERE d.is_wicket
+                CALL {
+                    WITH d
+                    MATCH (d)-[f:CAUGHT_BY|STUMPED_BY|RUN_OUT_BY]->(p:Player)
+                    RETURN p, type(f) as credit
+                    UNION ALL
+                    WITH d
+                    MATCH (d)-[:BOWLED_BY]->(p:Player)
+                    WHERE d.wicket_kind = 'caught and bowled'
+                    RETURN p, 'CAUGHT_BY' as credit
+                }
+                WITH m, p,
+                     SUM(CASE WHEN credit = 'CAUGHT_BY' THEN 1 ELSE 0 END) as catches,
+                     SUM(CASE WHEN credit = 'STUMPED_BY' THEN 1 ELSE 0 END) as stumpings,
+                     SUM(CASE WHEN credit = 'RUN_OUT_BY' THEN 1 ELSE 0 END) as run_outs
+                MERGE (p)-[fs:FIELDING_STATS]->(m)
+                SET fs.catches = catches,
+                    fs.stumpings = stumpings,
+                    fs.run_outs = run_outs
+            } IN TRANSACTIONS OF $batch_size ROWS
+        """, match_ids=match_ids, batch_size=self.STATS_BATCH_SIZE).consume()
         
-        logger.info(f"Computed aggregated stats for match {match_id}")
+        logger.info(f"Computed aggregated stats for {len(match_ids)} matches")
     
-    def compute_and_store_partnership_stats(self, session, match_id: str):
+    def compute_and_store_score_totals(self, session, match_ids: List[str]):
         """
-        Compute partnership statistics between batting pairs.
-        Creates PARTNERSHIP relationships with runs, balls, and wicket_ended properties.
+        Store Over and Innings totals (see SCORE_TOTALS_SUBQUERY) for the given
+        matches, which the bulk writer computes while building each payload.
+
+        Committed STATS_BATCH_SIZE innings per transaction with CALL {} IN
+        TRANSACTIONS (needs an auto-commit session.run).
         """
+        session.run(f"""
+            UNWIND $match_ids as match_id
+            MATCH (i:Innings {{match_id: match_id}})
+            CALL {{ {SCORE_TOTALS_SUBQUERY} }} IN TRANSACTIONS OF $batch_size ROWS
+        """, match_ids=match_ids, batch_size=self.STATS_BATCH_SIZE).consume()
         
-        session.run("""
-            MATCH (m:Match {match_id: $match_id})
-            MATCH (d:Delivery {match_id: $match_id})-[:FACED_BY]->(batter:Player)
-            MATCH (d)-[:NON_STRIKER]->(non_striker:Player)
-            WITH m, batter, non_striker, d
-            ORDER BY d.delivery_number
-            WITH m, batter, non_striker,
-                 COLLECT(d) as deliveries,
-                 SUM(d.runs_total) as partnership_runs,
-                 COUNT(d) as partnership_balls,
-                 MAX(d.delivery_number) as last_delivery
-            WHERE partnership_balls > 0
-            WITH m, batter, non_striker, partnership_runs, partnership_balls, last_delivery,
-                 deliveries[0].innings_id as innings_id,
-                 CASE 
-                   WHEN ANY(d IN deliveries WHERE d.is_wicket AND (d)-[:DISMISSED]->(batter)) THEN true 
-                   ELSE false 
-                 END as wicket_ended
-            MERGE (batter)-[p:PARTNERSHIP {
-                match_id: $match_id,
-                innings_id: innings_id
-            }]->(non_striker)
-            SET p.runs = partnership_runs,
-                p.balls = partnership_balls,
-                p.wicket_ended = wicket_ended
-        """, match_id=match_id)
+        logger.info(f"Computed Over and Innings totals for {len(match_ids)} matches")
+    
+    def compute_and_store_partnership_stats(self, session, match_ids: List[str]):
+        """
+        Rebuild PARTNERSHIP relationships from stored deliveries.
+
+        Reads each chunk of STATS_BATCH_SIZE matches' deliveries in order and
+        runs them through segment_partnerships, the same segmenter the bulk
+        writer uses at import time, then replaces the chunk's partnerships in
+        one write transaction.
+        """
+        for start in range(0, len(match_ids), self.STATS_BATCH_SIZE):
+            chunk = match_ids[start:start + self.STATS_BATCH_SIZE]
+            result = session.run("""
+                UNWIND $match_ids as match_id
+                MATCH (d:Delivery {match_id: match_id})
+                OPTIONAL MATCH (d)-[:FACED_BY]->(batter:Player)
+                OPTIONAL MATCH (d)-[:NON_STRIKER]->(non_striker:Player)
+                RETURN d.match_id as match_id, d.innings_id as innings_id,
+                       d.over_number as over_number, d.runs_total as runs_total,
+                       d.extras_type = 'wides' as is_wide, d.wicket_kind as wicket_kind,
+                       batter.player_id as batter_id, non_striker.player_id as non_striker_id
+                ORDER BY d.innings_id, d.delivery_number
+            """, match_ids=chunk)
+            
+            innings_balls: Dict[tuple, List[Dict[str, Any]]] = {}
+            for record in result:
+                innings_balls.setdefault((record['match_id'], record['innings_id']), []).append(dict(record))
+            
+            partnerships = []
+            for (match_id, innings_id), balls in innings_balls.items():
+                partnerships.extend(self.segment_partnerships(match_id, innings_id, balls))
+            
+            def replace_partnerships(tx):
+                tx.run("""
+                    MATCH ()-[r:PARTNERSHIP]->()
+                    WHERE r.match_id IN $match_ids
+                    DELETE r
+                """, match_ids=chunk)
+                self.write_partnerships(tx, partnerships)
+            
+            session.execute_write(replace_partnerships)
         
-        logger.info(f"Computed partnership stats for match {match_id}")
+        logger.info(f"Computed partnership stats for {len(match_ids)} matches")
     
     def cleanup_database(self):
-        """Delete all data from the database to ensure clean import."""
+        """Delete all match data from the database to ensure clean import (schema history and data version are kept)."""
         with self.driver.session() as session:
             logger.info("Cleaning up existing data...")
             try:
-                session.run("MATCH (n) DETACH DELETE (n)")
+                session.run("MATCH (n) WHERE NOT n:SchemaMigration AND NOT n:DataVersion DETACH DELETE (n)")
                 logger.info("✓ Database cleaned successfully")
                 sys.stdout.flush()
             except Exception as e:
@@ -1076,6 +2011,49 @@ class IPLNeo4jImporter:
         
         return missing_files, missing_ids
     
+    @staticmethod
+    def hash_match_file(raw: bytes) -> str:
+        """Content hash of a match file's bytes, used as its import manifest entry."""
+        return hashlib.sha256(raw).hexdigest()
+    
+    def get_match_manifest(self) -> Dict[str, str]:
+        """Get the source_hash recorded on each imported Match node (None if never recorded)."""
+        with self.driver.session() as session:
+            result = session.run("MATCH (m:Match) RETURN m.match_id as match_id, m.source_hash as source_hash")
+            return {record['match_id']: record['source_hash'] for record in result}
+    
+    def get_changed_match_files(self, available_files: List[Path]) -> List[Path]:
+        """
+        Get imported matches whose JSON file no longer matches the manifest hash.
+
+        Matches imported before hashes were recorded are assumed unchanged and
+        have their current hash backfilled, rather than all being re-imported.
+        """
+        manifest = self.get_match_manifest()
+        changed_files = []
+        backfill = []
+        for json_file in available_files:
+            match_id = json_file.stem
+            if match_id not in manifest:
+                continue
+            with open(json_file, 'rb') as f:
+                source_hash = self.hash_match_file(f.read())
+            if manifest[match_id] is None:
+                backfill.append({'match_id': match_id, 'source_hash': source_hash})
+            elif manifest[match_id] != source_hash:
+                changed_files.append(json_file)
+        
+        if backfill:
+            with self.driver.session() as session:
+                session.run("""
+                    UNWIND $rows as row
+                    MATCH (m:Match {match_id: row.match_id})
+                    SET m.source_hash = row.source_hash
+                """, rows=backfill)
+            logger.info(f"Recorded content hashes for {len(backfill)} previously imported matches")
+        
+        return changed_files
+    
     def get_partial_match_ids(self) -> List[str]:
         """
         Detect partially imported matches (Match node exists but incomplete data).
@@ -1146,26 +2124,314 @@ class IPLNeo4jImporter:
                 except Exception as e:
                     logger.warning(f"Failed to delete partial data for {match_id}: {str(e)}")
     
-    def compute_all_stats(self, session, match_ids: List[str]):
-        """Compute and store stats for multiple matches."""
-        for match_id in match_ids:
-            try:
-                self.compute_and_store_aggregated_stats(session, match_id)
-                self.compute_and_store_partnership_stats(session, match_id)
-            except Exception as e:
-                logger.warning(f"Failed to compute stats for {match_id}: {str(e)}")
+    def compute_all_stats(self, session, match_ids: List[str], player_stats: bool = True):
+        """
+        Compute and store stats for the given matches with set-based batched statements.
+
+        player_stats=False skips BATTING_STATS/BOWLING_STATS/FIELDING_STATS and
+        the Over/Innings totals, which the bulk writer already stores with each match.
+        """
+        if not match_ids:
+            return
+        try:
+            if player_stats:
+                self.compute_and_store_aggregated_stats(session, match_ids)
+                self.compute_and_store_score_totals(session, match_ids)
+            self.compute_and_store_partnership_stats(session, match_ids)
+        except Exception as e:
+            logger.warning(f"Failed to compute stats for {len(match_ids)} matches: {str(e)}")
     
-    def import_all_matches(self, batch_size: int = 10):
+    def recompute_all_stats(self):
+        """Recompute player stats, Over/Innings totals and PARTNERSHIP for every match in the database."""
+        with self.driver.session() as session:
+            result = session.run("MATCH (m:Match) RETURN m.match_id as match_id")
+            match_ids = [record['match_id'] for record in result]
+            logger.info(f"Recomputing stats for all {len(match_ids)} matches...")
+            self.compute_all_stats(session, match_ids)
+    
+    @staticmethod
+    def player_slug(name: str) -> str:
+        """URL slug of a player name; keep in sync with backend analytics_engine.player_slug and the frontend."""
+        return re.sub(r'[^a-z0-9-]', '', re.sub(r'\s+', '-', name.lower()))
+
+    @classmethod
+    def build_player_profile(cls, player_id: str, name: str, batting: List[Dict], bowling: List[Dict],
+                             teams: List[Dict]) -> Dict[str, Any]:
+        """
+        Build a player's profile document from their per-match stats in one pass.
+
+        batting and bowling hold one entry per BATTING_STATS/BOWLING_STATS
+        relationship, teams one per SELECTED_PLAYER. The document keeps raw team
+        names; the API applies its team filters and rebranding when serving it.
+        """
+        career_batting = {'runs': 0, 'balls': 0, 'innings': 0, 'highest': 0, 'fifties': 0,
+                          'centuries': 0, 'fours': 0, 'sixes': 0, 'outs': 0}
+        career_bowling = {'wickets': 0, 'runs': 0, 'balls': 0, 'innings': 0, 'best': 0}
+        seasons: Dict[str, Dict[str, Dict[str, int]]] = {}
+        form: Dict[str, Dict[str, Any]] = {}
+
+        def season_totals(season) -> Dict[str, Dict[str, int]]:
+            return seasons.setdefault(str(season), {'batting': dict.fromkeys(career_batting, 0),
+                                                    'bowling': dict.fromkeys(career_bowling, 0)})
+
+        for inn in batting:
+            runs = inn.get('runs') or 0
+            for totals in (career_batting, season_totals(inn.get('season'))['batting']):
+                totals['runs'] += runs
+                totals['balls'] += inn.get('balls') or 0
+                totals['innings'] += 1
+                totals['highest'] = max(totals['highest'], runs)
+                totals['fifties'] += 50 <= runs < 100
+                totals['centuries'] += runs >= 100
+                totals['fours'] += inn.get('fours') or 0
+                totals['sixes'] += inn.get('sixes') or 0
+                totals['outs'] += bool(inn.get('out'))
+            form.setdefault(inn['match_id'], {'match_id': inn['match_id'], 'date': inn.get('date'),
+                                              'season': inn.get('season')}).update(
+                runs=runs, balls=inn.get('balls') or 0, out=bool(inn.get('out')))
+
+        for inn in bowling:
+            wickets = inn.get('wickets') or 0
+            for totals in (career_bowling, season_totals(inn.get('season'))['bowling']):
+                totals['wickets'] += wickets
+                totals['runs'] += inn.get('runs') or 0
+                totals['balls'] += inn.get('balls') or 0
+                totals['innings'] += 1
+                totals['best'] = max(totals['best'], wickets)
+            form.setdefault(inn['match_id'], {'match_id': inn['match_id'], 'date': inn.get('date'),
+                                              'season': inn.get('season')}).update(
+                wickets=wickets, runs_conceded=inn.get('runs') or 0, balls_bowled=inn.get('balls') or 0)
+
+        # The last team seen in a season wins; cricsheet match ids increase over time
+        team_history = {}
+        for entry in sorted(teams, key=lambda t: (len(t['match_id'] or ''), t['match_id'] or '')):
+            if entry.get('season') and entry.get('team'):
+                team_history[str(entry['season'])] = entry['team']
+
+        recent_form = sorted(form.values(), key=lambda m: (m['date'] or '', m['match_id']), reverse=True)
+        return {
+            'player_id': player_id,
+            'name': name,
+            'slug': cls.player_slug(name),
+            'matches': len(form),
+            'batting': career_batting,
+            'bowling': career_bowling,
+            'seasons': seasons,
+            'team_history': team_history,
+            'recent_form': recent_form[:cls.PROFILE_RECENT_FORM],
+        }
+
+    def get_match_player_ids(self, match_ids: List[str]) -> Set[str]:
+        """Ids of the players with stats in, or selected for, any of match_ids."""
+        if not match_ids:
+            return set()
+        with self.driver.session() as session:
+            result = session.run("""
+                UNWIND $match_ids as match_id
+                MATCH (p:Player)-[:BATTING_STATS|BOWLING_STATS]->(:Match {match_id: match_id})
+                RETURN p.player_id as player_id
+                UNION
+                MATCH (:Team)-[sp:SELECTED_PLAYER]->(p:Player)
+                WHERE sp.match_id IN $match_ids
+                RETURN p.player_id as player_id
+            """, match_ids=match_ids)
+            return {record['player_id'] for record in result}
+
+    def refresh_player_profiles(self, match_ids: List[str] = None, player_ids: Set[str] = None) -> int:
+        """
+        Rebuild the (:PlayerProfile) document of every player in match_ids (all players if None).
+
+        player_ids adds players to rebuild who may no longer appear in
+        match_ids, such as players dropped from a corrected scorecard.
+
+        Each profile is read with pattern comprehensions over the player's
+        BATTING_STATS, BOWLING_STATS and SELECTED_PLAYER relationships, built in
+        Python and stored as JSON, so the API serves a profile with one indexed
+        lookup by slug. A failure is logged, not raised; the API falls back to
+        its live query for players without a profile.
+
+        Returns:
+            The number of profiles written
+        """
+        written = 0
+        try:
+            if match_ids is None:
+                with self.driver.session() as session:
+                    result = session.run("MATCH (p:Player) RETURN p.player_id as player_id")
+                    player_ids = [record['player_id'] for record in result]
+            else:
+                player_ids = sorted(self.get_match_player_ids(match_ids) | set(player_ids or ()))
+            logger.info(f"Building profiles for {len(player_ids)} players...")
+
+            with self.driver.session() as session:
+                for start in range(0, len(player_ids), self.PROFILE_BATCH_SIZE):
+                    records = session.run("""
+                        UNWIND $player_ids as player_id
+                        MATCH (p:Player {player_id: player_id})
+                        RETURN p.player_id as player_id, p.name as name,
+                               [(p)-[bs:BATTING_STATS]->(m:Match) | {match_id: m.match_id, date: m.date,
+                                   season: m.season, runs: bs.runs, balls: bs.balls, fours: bs.fours,
+                                   sixes: bs.sixes, out: bs.out}] as batting,
+                               [(p)-[bw:BOWLING_STATS]->(m:Match) | {match_id: m.match_id, date: m.date,
+                                   season: m.season, wickets: bw.wickets, runs: bw.runs_conceded,
+                                   balls: bw.balls}] as bowling,
+                               [(t:Team)-[sp:SELECTED_PLAYER]->(p) | {team: t.name, season: sp.season,
+                                   match_id: sp.match_id}] as teams
+                    """, player_ids=player_ids[start:start + self.PROFILE_BATCH_SIZE]).data()
+                    profiles = []
+                    for record in records:
+                        document = self.build_player_profile(**record)
+                        profiles.append({'player_id': document['player_id'], 'slug': document['slug'],
+                                         'name': document['name'], 'matches': document['matches'],
+                                         'document': json.dumps(document)})
+                    session.execute_write(lambda tx: tx.run("""
+                        UNWIND $profiles as profile
+                        MERGE (pp:PlayerProfile {player_id: profile.player_id})
+                        SET pp.slug = profile.slug,
+                            pp.name = profile.name,
+                            pp.matches = profile.matches,
+                            pp.document = profile.document,
+                            pp.updated_at = datetime()
+                    """, profiles=profiles).consume())
+                    written += len(profiles)
+        except Exception as e:
+            logger.error(f"❌ Player profile rebuild failed after {written} profiles: {e}")
+            return written
+
+        logger.info(f"✓ Rebuilt {written} player profiles")
+        return written
+
+    def publish_data_version(self, imported_count: int, match_ids: List[str] = None,
+                             rebuild_all_profiles: bool = False, player_ids: Set[str] = None) -> int:
+        """
+        Rebuild player profiles, then bump the data version, after a run changed data.
+
+        Args:
+            imported_count: Matches imported by the run
+            match_ids: Matches written by the run ([] when only derived stats
+                changed; None when every match was written)
+            rebuild_all_profiles: Rebuild every profile rather than those of
+                the players in match_ids
+            player_ids: Further players whose profiles need rebuilding (see
+                refresh_player_profiles)
+
+        Returns:
+            The new data version
+        """
+        full_rebuild = rebuild_all_profiles or match_ids is None
+        self.refresh_player_profiles(None if full_rebuild else match_ids, player_ids)
+        return self.bump_data_version(imported_count, match_ids)
+
+    def count_player_profiles(self) -> int:
+        with self.driver.session() as session:
+            return session.run("MATCH (pp:PlayerProfile) RETURN count(pp) as count").single()['count']
+
+    def import_matches_parallel(self, json_files: List[Path], batch_size: int = 10,
+                                parse_workers: int = None, writer_threads: int = 4,
+                                queue_size: int = 8) -> tuple[int, int]:
+        """
+        Import matches through a parse -> queue -> write pipeline.
+
+        A process pool parses JSON files and builds write payloads, a bounded
+        queue hands batches of payloads to writer_threads threads, and each
+        writer commits its batches on its own session. The queue and the cap
+        on in-flight parse jobs keep memory bounded when Neo4j is the
+        bottleneck.
+
+        Returns:
+            Tuple of (matches committed, matches failed)
+        """
+        parse_workers = parse_workers or os.cpu_count() or 1
+        batch_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        counts = {'imported': 0, 'failed': 0}
+        counts_lock = threading.Lock()
+        total_files = len(json_files)
+
+        def writer():
+            with self.driver.session() as session:
+                while True:
+                    batch = batch_queue.get()
+                    try:
+                        if batch is None:
+                            return
+                        committed, failed = self.import_match_batch(session, batch, self.write_payloads)
+                        with counts_lock:
+                            counts['imported'] += committed
+                            counts['failed'] += failed
+                            logger.info(f"Progress: {counts['imported']}/{total_files} matches imported")
+                            sys.stdout.flush()
+                    finally:
+                        batch_queue.task_done()
+
+        writers = [threading.Thread(target=writer, name=f"neo4j-writer-{n}", daemon=True)
+                   for n in range(max(1, writer_threads))]
+        for thread in writers:
+            thread.start()
+
+        logger.info(f"Parallel import: {parse_workers} parse workers, {len(writers)} writers, "
+                    f"batch size {batch_size}")
+
+        batch: List[tuple] = []
+        max_pending = parse_workers * 4
+        with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+            pending = deque()
+            files = iter(json_files)
+            while True:
+                # Keep a bounded number of parse jobs in flight, in file order
+                while len(pending) < max_pending:
+                    json_file = next(files, None)
+                    if json_file is None:
+                        break
+                    pending.append(pool.submit(parse_match_file, str(json_file)))
+                if not pending:
+                    break
+
+                result = pending.popleft().result()
+                if result['error']:
+                    with counts_lock:
+                        counts['failed'] += 1
+                    self.log_import_error(f"{result['match_id']}.json", Exception(result['error']))
+                    continue
+
+                self.write_skipped_fields(result['match_id'], result['skipped_fields'])
+                batch.append((result['match_id'], result['payload']))
+                if len(batch) >= batch_size:
+                    batch_queue.put(batch)
+                    batch = []
+
+        if batch:
+            batch_queue.put(batch)
+        for _ in writers:
+            batch_queue.put(None)
+        for thread in writers:
+            thread.join()
+
+        return counts['imported'], counts['failed']
+
+    def import_all_matches(self, batch_size: int = 10, parse_workers: int = None,
+                           writer_threads: int = 1, recompute_all_stats: bool = False):
         """
         Import all matches in chronological order.
         Resumes from where it left off if partially imported.
         
         Args:
-            batch_size: Number of matches to commit per transaction
+            batch_size: Number of matches to commit per write transaction
+            parse_workers: Processes used to parse JSON in the parallel pipeline
+                (defaults to the CPU count)
+            writer_threads: Concurrent Neo4j writers; more than one enables the
+                parallel pipeline (bulk write mode only)
+            recompute_all_stats: Recompute derived stats for every match instead
+                of only the matches imported in this run
         """
+        # Bring constraints and indexes up to date before touching match data
+        logger.info("Checking schema migrations...")
+        self.apply_schema_migrations()
+        
         # Check if any matches are already imported
         imported_ids = self.get_imported_match_ids()
         available_files = self.get_sorted_json_files()
+        # Players of matches about to be deleted or replaced; a corrected scorecard may drop some of them
+        previous_player_ids: Set[str] = set()
         
         if imported_ids:
             # Resume mode: only import missing matches
@@ -1181,14 +2447,21 @@ class IPLNeo4jImporter:
                 logger.warning(f"\n⚠️  Found {len(partial_matches)} partially imported matches!")
                 logger.info(f"Matches: {', '.join(partial_matches[:10])}{'...' if len(partial_matches) > 10 else ''}")
                 logger.info("These will be deleted and re-imported...")
+                previous_player_ids |= self.get_match_player_ids(partial_matches)
                 self.delete_partial_matches(partial_matches)
                 logger.info("✓ Partial imports cleaned up\n")
             
             missing_files, missing_ids = self.get_missing_match_ids()
             
-            # Add partial matches back to the import list
+            # Matches whose JSON changed since import are replaced in place
+            changed_files = self.get_changed_match_files(available_files)
+            if changed_files:
+                logger.info(f"Found {len(changed_files)} changed match files; they will be re-imported")
+                previous_player_ids |= self.get_match_player_ids([f.stem for f in changed_files])
+            
+            # Add partial and changed matches back to the import list
             partial_files = [f for f in available_files if f.stem in partial_matches]
-            json_files = sorted(missing_files + partial_files, key=lambda x: int(x.stem))
+            json_files = sorted(missing_files + partial_files + changed_files, key=lambda x: int(x.stem))
             
             total_files = len(json_files)
             
@@ -1196,22 +2469,34 @@ class IPLNeo4jImporter:
                 logger.info("✓ All matches already imported! Database is complete.")
                 sys.stdout.flush()
                 
+                if recompute_all_stats:
+                    self.recompute_all_stats()
+                    self.publish_data_version(0, match_ids=[], rebuild_all_profiles=True)
+                    return
+                
                 # Still compute stats as they might be missing
                 logger.info("\nVerifying aggregated statistics...")
-                with self.driver.session() as session:
-                    result = session.run("MATCH (m:Match) RETURN m.match_id as match_id")
-                    match_ids = [record['match_id'] for record in result]
-                
-                # Check if stats are computed
                 with self.driver.session() as session:
                     result = session.run("MATCH (p:Player)-[bs:BATTING_STATS]->(m:Match) RETURN COUNT(bs) as count")
                     stats_count = result.single()['count']
-                    
-                    if stats_count == 0:
-                        logger.info("Stats not computed yet. Computing now...")
-                        self.compute_all_stats(session, match_ids)
-                    else:
-                        logger.info(f"✓ Stats already computed: {stats_count} batting stats relationships found")
+                    result = session.run("MATCH ()-[ps:PARTNERSHIP]->() RETURN COUNT(ps) as count")
+                    partnership_count = result.single()['count']
+                
+                if stats_count == 0:
+                    logger.info("Stats not computed yet. Computing now...")
+                    self.recompute_all_stats()
+                    self.publish_data_version(0, match_ids=[], rebuild_all_profiles=True)
+                elif partnership_count == 0:
+                    # Player stats are stored but partnerships are not, e.g. a database imported before PARTNERSHIP existed
+                    logger.info("Partnerships not computed yet. Computing now...")
+                    with self.driver.session() as session:
+                        self.compute_all_stats(session, sorted(imported_ids), player_stats=False)
+                    self.publish_data_version(0, match_ids=[], rebuild_all_profiles=True)
+                else:
+                    logger.info(f"✓ Stats already computed: {stats_count} batting stats relationships found")
+                    if not self.count_player_profiles():
+                        logger.info("Player profiles not built yet. Building now...")
+                        self.publish_data_version(0, match_ids=[], rebuild_all_profiles=True)
                 
                 return
             
@@ -1233,54 +2518,57 @@ class IPLNeo4jImporter:
             if os.path.exists(self.skipped_fields_log):
                 os.remove(self.skipped_fields_log)
         
-        # Create constraints and indexes first
-        logger.info("Creating constraints and indexes...")
-        self.create_constraints_and_indexes()
-        
-        # Import matches
+        # Import matches, committing batch_size matches per write transaction
+        batch_size = max(1, batch_size)
         imported_count = 0
         failed_count = 0
+        batch: List[tuple] = []
         
-        # Open a single session for the entire import
-        with self.driver.session() as session:
-            for i, json_file in enumerate(json_files, 1):
-                try:
-                    with open(json_file, 'r') as f:
-                        match_data = json.load(f)
-                    
-                    match_id = json_file.stem
-                    
-                    # Import the match
-                    logger.info(f"[{i}/{total_files}] Importing match {match_id}...")
-                    sys.stdout.flush()
-                    
-                    self.import_match(session, match_data, match_id)
-                    logger.info(f"  ✓ Match {match_id} created")
-                    sys.stdout.flush()
-                    
-                    # Log any skipped fields
-                    self.log_skipped_fields(match_id, match_data)
-                    
-                    imported_count += 1
+        if self.bulk_write and writer_threads > 1:
+            imported_count, failed_count = self.import_matches_parallel(
+                json_files, batch_size, parse_workers, writer_threads
+            )
+        else:
+            # Open a single session for the entire import
+            with self.driver.session() as session:
+                for i, json_file in enumerate(json_files, 1):
+                    try:
+                        with open(json_file, 'rb') as f:
+                            raw = f.read()
+                        match_data = json.loads(raw)
+                        
+                        match_id = json_file.stem
+                        logger.info(f"[{i}/{total_files}] Queued match {match_id}")
+                        batch.append((match_id, match_data, self.hash_match_file(raw)))
+                        
+                        # Log any skipped fields
+                        self.log_skipped_fields(match_id, match_data)
+                    except Exception as e:
+                        failed_count += 1
+                        self.log_import_error(json_file.name, e)
                     
-                    if imported_count % 10 == 0:
+                    if len(batch) >= batch_size or (i == total_files and batch):
+                        committed, failed = self.import_match_batch(session, batch)
+                        imported_count += committed
+                        failed_count += failed
+                        batch = []
                         logger.info(f"Progress: {imported_count}/{total_files} matches imported")
                         sys.stdout.flush()
-                        
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(f"Failed to import {json_file.name}: {str(e)}")
-                    # Log the error
-                    with open("import_errors.log", 'a') as f:
-                        f.write(f"{datetime.now().isoformat()} - {json_file.name}: {str(e)}\n")
         
-        # Compute all stats after matches are imported
-        logger.info("\nComputing aggregated statistics...")
-        with self.driver.session() as session:
-            # Get all match IDs for stats computation
-            result = session.run("MATCH (m:Match) RETURN m.match_id as match_id")
-            match_ids = [record['match_id'] for record in result]
-            self.compute_all_stats(session, match_ids)
+        # Compute stats only for the matches written in this run; the bulk
+        # writer already stored player stats and partnerships with each match
+        if recompute_all_stats:
+            self.recompute_all_stats()
+        elif not self.bulk_write:
+            logger.info("\nComputing aggregated statistics...")
+            with self.driver.session() as session:
+                self.compute_all_stats(session, [json_file.stem for json_file in json_files])
+        
+        # Rebuild profiles of the players in this run's matches, then let the API know its caches are out of date
+        if imported_count or recompute_all_stats:
+            written_ids = [json_file.stem for json_file in json_files] if imported_ids else None
+            self.publish_data_version(imported_count, written_ids, rebuild_all_profiles=recompute_all_stats,
+                                      player_ids=previous_player_ids)
         
         logger.info(f"\n{'='*80}")
         logger.info(f"Import completed!")
@@ -1328,68 +2616,774 @@ class IPLNeo4jImporter:
             logger.info(f"  Players: {players}")
             logger.info(f"  Deliveries (Balls): {deliveries}")
 
+class BulkCSVExporter:
+    """
+    Exports the match graph as CSV files for `neo4j-admin database import full`.
+
+    Rows come from IPLNeo4jImporter.build_match_payload, so a bulk-loaded
+    database holds the same nodes, properties and relationships as one built
+    by the transactional importer. Shared nodes keep the properties of their
+    first appearance, matching the importer's ON CREATE SET semantics.
+    Per-match player stats and partnerships are exported with each match, so
+    the loaded database needs no post-processing beyond schema migrations.
+    """
+
+    # Label -> (id property, [(property, neo4j-admin type)])
+    NODE_COLUMNS = {
+        'Season': ('year', []),
+        'Venue': ('name', [('city', 'string')]),
+        'Team': ('name', [('team_type', 'string')]),
+        'Player': ('player_id', [('name', 'string')]),
+        'Official': ('name', [('role', 'string')]),
+        'Match': ('match_id', [
+            ('date', 'string'), ('season', 'string'), ('venue', 'string'), ('city', 'string'),
+            ('match_number', 'int'), ('match_type', 'string'), ('gender', 'string'),
+            ('winner', 'string'), ('outcome_type', 'string'), ('outcome_margin', 'int'),
+            ('toss_winner', 'string'), ('toss_decision', 'string'),
+            ('balls_per_over', 'int'), ('overs', 'int'), ('source_hash', 'string')
+        ]),
+        'Innings': ('innings_id', [
+            ('match_id', 'string'), ('innings_number', 'int'), ('batting_team', 'string'),
+            ('total_runs', 'int'), ('total_wickets', 'int'),
+            ('target_runs', 'int'), ('target_overs', 'float'),
+            ('powerplay_from', 'float'), ('powerplay_to', 'float'),
+            ('powerplay_types', 'string[]'), ('powerplay_from_overs', 'float[]'),
+            ('powerplay_to_overs', 'float[]'),
+            ('extras', 'int'), ('fours', 'int'), ('sixes', 'int'), ('legal_balls', 'int'),
+            ('overs_bowled', 'float'), ('run_rate', 'float')
+        ]),
+        'Over': ('over_id', [
+            ('innings_id', 'string'), ('match_id', 'string'), ('over_number', 'int'),
+            ('runs', 'int'), ('wickets', 'int'), ('extras', 'int'), ('fours', 'int'), ('sixes', 'int'),
+            ('legal_balls', 'int'), ('cumulative_runs', 'int'), ('cumulative_wickets', 'int')
+        ]),
+        'Delivery': ('delivery_id', [
+            ('match_id', 'string'), ('innings_id', 'string'), ('over_id', 'string'),
+            ('delivery_number', 'int'), ('over_number', 'int'), ('ball_in_over', 'int'),
+            ('runs_batter', 'int'), ('runs_extras', 'int'), ('runs_total', 'int'),
+            ('extras_type', 'string'), ('is_wicket', 'boolean'), ('wicket_kind', 'string'),
+            ('is_boundary', 'boolean'), ('is_six', 'boolean'), ('is_non_boundary', 'boolean'),
+            ('review_by', 'string'), ('review_umpire', 'string'), ('review_decision', 'string'),
+            ('review_type', 'string'), ('umpires_call', 'boolean')
+        ]),
+    }
+
+    # Relationship type -> (start label, end label, [(property, neo4j-admin type)])
+    RELATIONSHIP_COLUMNS = {
+        'PLAYED_IN': ('Match', 'Season', []),
+        'HELD_AT': ('Match', 'Venue', []),
+        'TEAM_INVOLVED': ('Match', 'Team', [('role', 'string')]),
+        'WON_BY': ('Match', 'Team', []),
+        'TOSS_WON_BY': ('Match', 'Team', []),
+        'PLAYER_OF_MATCH': ('Match', 'Player', []),
+        'OFFICIATED_BY': ('Match', 'Official', [('role', 'string')]),
+        'SELECTED_PLAYER': ('Team', 'Player', [('match_id', 'string'), ('season', 'string')]),
+        'HAS_INNINGS': ('Match', 'Innings', [('innings_number', 'int')]),
+        'BATTING_TEAM': ('Innings', 'Team', []),
+        'HAS_OVER': ('Innings', 'Over', [('over_number', 'int')]),
+        'HAS_DELIVERY': ('Over', 'Delivery', [('position', 'int')]),
+        'BOWLED_BY': ('Delivery', 'Player', []),
+        'FACED_BY': ('Delivery', 'Player', []),
+        'NON_STRIKER': ('Delivery', 'Player', []),
+        'DISMISSED': ('Delivery', 'Player', [('kind', 'string')]),
+        'CAUGHT_BY': ('Delivery', 'Player', [('substitute', 'boolean')]),
+        'STUMPED_BY': ('Delivery', 'Player', [('substitute', 'boolean')]),
+        'RUN_OUT_BY': ('Delivery', 'Player', [('substitute', 'boolean')]),
+        'BATTING_STATS': ('Player', 'Match', [
+            ('runs', 'int'), ('balls', 'int'), ('fours', 'int'), ('sixes', 'int'), ('dots', 'int'),
+            ('strike_rate', 'float'), ('dismissal_type', 'string'), ('out', 'boolean')
+        ]),
+        'BOWLING_STATS': ('Player', 'Match', [
+            ('overs', 'float'), ('balls', 'int'), ('runs_conceded', 'int'), ('wickets', 'int'),
+            ('economy', 'float'), ('dots', 'int'), ('fours_conceded', 'int'), ('sixes_conceded', 'int'),
+            ('strike_rate', 'float')
+        ]),
+        'FIELDING_STATS': ('Player', 'Match', [
+            ('catches', 'int'), ('stumpings', 'int'), ('run_outs', 'int')
+        ]),
+        'PARTNERSHIP': ('Player', 'Player', [
+            ('match_id', 'string'), ('innings_id', 'string'), ('partnership_number', 'int'),
+            ('runs', 'int'), ('balls', 'int'), ('from_over', 'int'), ('to_over', 'int'),
+            ('wicket_ended', 'boolean')
+        ]),
+    }
+
+    ARRAY_DELIMITER = ';'
+
+    def __init__(self, json_folder: str, output_dir: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            json_folder: Path to folder containing IPL JSON files
+            output_dir: Directory the CSV files are written to
+        """
+        self.json_folder = Path(json_folder)
+        self.output_dir = Path(output_dir)
+
+    @staticmethod
+    def node_file(label: str) -> str:
+        return f"nodes_{label}.csv"
+
+    @staticmethod
+    def relationship_file(rel_type: str) -> str:
+        return f"rels_{rel_type}.csv"
+
+    @classmethod
+    def format_value(cls, value: Any) -> Any:
+        """Render a property value the way neo4j-admin parses it; None becomes an empty field."""
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, list):
+            return cls.ARRAY_DELIMITER.join(str(cls.format_value(v)) for v in value)
+        return value
+
+    @staticmethod
+    def column_header(name: str, value_type: str) -> str:
+        return name if value_type == 'string' else f"{name}:{value_type}"
+
+    @classmethod
+    def match_rows(cls, payload: Dict[str, Any]) -> tuple[Dict[str, list], Dict[str, list]]:
+        """
+        Split a match payload into node rows and relationship rows.
+
+        Node rows are (id, {property: value}); relationship rows are
+        (start id, end id, {property: value}).
+        """
+        match_id = payload['match_id']
+        season = payload['season']
+        nodes = {
+            'Season': [(season, {})],
+            'Venue': [(payload['venue'], {'city': payload['city']})],
+            'Team': [(t['name'], {'team_type': payload['team_type']}) for t in payload['teams']],
+            'Player': [(p['id'], {'name': p['name']}) for p in payload['players']],
+            'Official': [(o['name'], {'role': o['role']}) for o in payload['officials']],
+            'Match': [(match_id, payload['match'])],
+            'Innings': [(i['innings_id'], i['props']) for i in payload['innings']],
+            'Over': [(o['over_id'], o['props']) for o in payload['overs']],
+            'Delivery': [(d['delivery_id'], d['props']) for d in payload['deliveries']],
+        }
+        team_names = {t['name'] for t in payload['teams']}
+        rels = {
+            'PLAYED_IN': [(match_id, season, {})],
+            'HELD_AT': [(match_id, payload['venue'], {})],
+            'TEAM_INVOLVED': [(match_id, t['name'], {'role': t['role']}) for t in payload['teams']],
+            'WON_BY': [(match_id, payload['winner'], {})] if payload['winner'] in team_names else [],
+            'TOSS_WON_BY': [(match_id, payload['toss_winner'], {})] if payload['toss_winner'] in team_names else [],
+            'PLAYER_OF_MATCH': [(match_id, pid, {}) for pid in payload['player_of_match']],
+            'OFFICIATED_BY': [(match_id, o['name'], {'role': o['role']}) for o in payload['officials']],
+            'SELECTED_PLAYER': [(s['team'], s['player_id'], {'match_id': match_id, 'season': season})
+                                for s in payload['squad']],
+            'HAS_INNINGS': [(match_id, i['innings_id'], {'innings_number': i['innings_number']})
+                            for i in payload['innings']],
+            'BATTING_TEAM': [(i['innings_id'], i['batting_team'], {}) for i in payload['innings']
+                             if i['batting_team'] in team_names],
+            'HAS_OVER': [(o['innings_id'], o['over_id'], {'over_number': o['over_number']})
+                         for o in payload['overs']],
+            'HAS_DELIVERY': [(d['over_id'], d['delivery_id'], {'position': d['ball_in_over']})
+                             for d in payload['deliveries']],
+        }
+        for rel_type in ('BATTING_STATS', 'BOWLING_STATS', 'FIELDING_STATS'):
+            rels[rel_type] = [(r['player_id'], match_id, r['props']) for r in payload[rel_type.lower()]]
+        rels['PARTNERSHIP'] = [(p['player1_id'], p['player2_id'], p['props']) for p in payload['partnerships']]
+        for rel_type, rows in payload['player_links'].items():
+            rels[rel_type] = [(r['delivery_id'], r['player_id'],
+                               {k: v for k, v in r.items() if k not in ('delivery_id', 'player_id')})
+                              for r in rows]
+        return nodes, rels
+
+    @classmethod
+    def csv_rows(cls, json_file: str) -> tuple[Dict[str, list], Dict[str, list]]:
+        """
+        Build formatted CSV rows for one match file.
+
+        Runs in the export process pool. MERGE never creates the same
+        relationship twice, so identical relationship rows within a match are
+        returned once.
+        """
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+        payload = IPLNeo4jImporter.build_match_payload(
+            json.loads(raw), Path(json_file).stem, IPLNeo4jImporter.hash_match_file(raw)
+        )
+        nodes, rels = cls.match_rows(payload)
+
+        node_rows = {
+            label: [[node_id] + [cls.format_value(props.get(name)) for name, _ in cls.NODE_COLUMNS[label][1]]
+                    + [label] for node_id, props in rows]
+            for label, rows in nodes.items()
+        }
+        rel_rows = {}
+        for rel_type, rows in rels.items():
+            columns = cls.RELATIONSHIP_COLUMNS[rel_type][2]
+            unique_rows = dict.fromkeys(
+                (start, end) + tuple(cls.format_value(props.get(name)) for name, _ in columns) + (rel_type,)
+                for start, end, props in rows
+            )
+            rel_rows[rel_type] = list(unique_rows)
+        return node_rows, rel_rows
+
+    def export(self, json_files: List[Path] = None, workers: int = None) -> Dict[str, int]:
+        """
+        Write node and relationship CSVs for every match file.
+
+        Matches are parsed and formatted in a process pool and written in
+        file order, so shared nodes keep their first (oldest) properties.
+
+        Returns:
+            Row count per CSV file
+        """
+        json_files = json_files if json_files is not None else IPLNeo4jImporter.sort_match_files(self.json_folder)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        seen_nodes = {label: set() for label in self.NODE_COLUMNS}
+        counts: Dict[str, int] = {}
+        handles = []
+        try:
+            node_writers = {}
+            for label, (id_prop, columns) in self.NODE_COLUMNS.items():
+                f = open(self.output_dir / self.node_file(label), 'w', newline='')
+                handles.append(f)
+                writer = csv.writer(f)
+                writer.writerow([f"{id_prop}:ID({label})"]
+                                + [self.column_header(name, t) for name, t in columns] + [':LABEL'])
+                node_writers[label] = writer
+                counts[self.node_file(label)] = 0
+
+            rel_writers = {}
+            for rel_type, (start, end, columns) in self.RELATIONSHIP_COLUMNS.items():
+                f = open(self.output_dir / self.relationship_file(rel_type), 'w', newline='')
+                handles.append(f)
+                writer = csv.writer(f)
+                writer.writerow([f":START_ID({start})", f":END_ID({end})"]
+                                + [self.column_header(name, t) for name, t in columns] + [':TYPE'])
+                rel_writers[rel_type] = writer
+                counts[self.relationship_file(rel_type)] = 0
+
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                for node_rows, rel_rows in pool.map(self.csv_rows, [str(f) for f in json_files], chunksize=16):
+                    for label, rows in node_rows.items():
+                        seen = seen_nodes[label]
+                        for row in rows:
+                            if row[0] in seen:
+                                continue
+                            seen.add(row[0])
+                            node_writers[label].writerow(row)
+                            counts[self.node_file(label)] += 1
+
+                    for rel_type, rows in rel_rows.items():
+                        rel_writers[rel_type].writerows(rows)
+                        counts[self.relationship_file(rel_type)] += len(rows)
+        finally:
+            for f in handles:
+                f.close()
+
+        logger.info(f"✓ Exported {len(json_files)} matches to {self.output_dir}")
+        for file_name, count in counts.items():
+            logger.info(f"  {file_name}: {count} rows")
+        return counts
+
+    def admin_import_command(self, database: str = "neo4j") -> str:
+        """Return the neo4j-admin command that loads the exported files into an empty database."""
+        args = [f"--nodes={label}={self.output_dir / self.node_file(label)}" for label in self.NODE_COLUMNS]
+        args += [f"--relationships={rel_type}={self.output_dir / self.relationship_file(rel_type)}"
+                 for rel_type in self.RELATIONSHIP_COLUMNS]
+        return (f"neo4j-admin database import full --overwrite-destination "
+                f"--array-delimiter='{self.ARRAY_DELIMITER}' " + " ".join(args) + f" {database}")
+
+    def verify(self, json_files: List[Path] = None) -> List[str]:
+        """
+        Check exported CSVs against the JSON corpus without a database.
+
+        Counts are recomputed straight from the JSON files, and every
+        relationship endpoint must exist in the matching node file.
+
+        Returns:
+            List of problems found (empty when the export is consistent)
+        """
+        json_files = json_files if json_files is not None else IPLNeo4jImporter.sort_match_files(self.json_folder)
+        expected = {label: set() for label in ('Season', 'Venue', 'Team', 'Player', 'Official')}
+        expected_counts = {'Match': 0, 'Innings': 0, 'Over': 0, 'Delivery': 0, 'DISMISSED': 0}
+
+        for json_file in json_files:
+            with open(json_file, 'r') as f:
+                match_data = json.load(f)
+            info = match_data.get('info', {})
+            registry = info.get('registry', {}).get('people', {})
+            expected['Season'].add(IPLNeo4jImporter.normalize_season(info.get('season', 'Unknown')))
+            expected['Venue'].add(info.get('venue', 'Unknown'))
+            expected['Team'].update(info.get('teams', []))
+            expected['Player'].update(registry.values())
+            expected['Official'].update(name for names in info.get('officials', {}).values() for name in names)
+            expected_counts['Match'] += 1
+            for innings_data in match_data.get('innings', []):
+                expected_counts['Innings'] += 1
+                for over_data in innings_data.get('overs', []):
+                    expected_counts['Over'] += 1
+                    for delivery in over_data.get('deliveries', []):
+                        expected_counts['Delivery'] += 1
+                        wickets = delivery.get('wickets', [])
+                        if wickets and registry.get(wickets[0].get('player_out')):
+                            expected_counts['DISMISSED'] += 1
+
+        problems = []
+        node_ids: Dict[str, Set[str]] = {}
+        for label in self.NODE_COLUMNS:
+            with open(self.output_dir / self.node_file(label), 'r', newline='') as f:
+                ids = [row[0] for row in list(csv.reader(f))[1:]]
+            node_ids[label] = set(ids)
+            if len(ids) != len(node_ids[label]):
+                problems.append(f"{self.node_file(label)}: {len(ids) - len(node_ids[label])} duplicate ids")
+            if label in expected and node_ids[label] != expected[label]:
+                problems.append(f"{self.node_file(label)}: {len(node_ids[label])} ids, "
+                                f"corpus has {len(expected[label])}")
+            if label in expected_counts and len(ids) != expected_counts[label]:
+                problems.append(f"{self.node_file(label)}: {len(ids)} rows, corpus has {expected_counts[label]}")
+
+        # Relationships whose count is fixed by the corpus
+        expected_rel_counts = {
+            'PLAYED_IN': expected_counts['Match'],
+            'HELD_AT': expected_counts['Match'],
+            'HAS_INNINGS': expected_counts['Innings'],
+            'HAS_OVER': expected_counts['Over'],
+            'HAS_DELIVERY': expected_counts['Delivery'],
+            'DISMISSED': expected_counts['DISMISSED'],
+        }
+        for rel_type, (start, end, _) in self.RELATIONSHIP_COLUMNS.items():
+            file_name = self.relationship_file(rel_type)
+            with open(self.output_dir / file_name, 'r', newline='') as f:
+                rows = list(csv.reader(f))[1:]
+            dangling = sum(1 for row in rows if row[0] not in node_ids[start] or row[1] not in node_ids[end])
+            if dangling:
+                problems.append(f"{file_name}: {dangling} rows reference missing nodes")
+            if rel_type in expected_rel_counts and len(rows) != expected_rel_counts[rel_type]:
+                problems.append(f"{file_name}: {len(rows)} rows, corpus has {expected_rel_counts[rel_type]}")
+
+        return problems
+
+
+class ColumnarSnapshotExporter:
+    """
+    Writes the match corpus as a versioned, season-partitioned columnar snapshot.
+
+    Analytical consumers can read deliveries from typed arrays instead of
+    re-parsing every JSON file or paging through Delivery nodes. Layout:
+
+        <output_dir>/CURRENT                    name of the newest complete snapshot
+        <output_dir>/v<data_version>/manifest.json
+        <output_dir>/v<data_version>/season=<season>/<column>.npy
+
+    Players, teams, venues, extras types and wicket kinds are dictionary-encoded:
+    columns hold integer codes into the lists in manifest.json (-1 for no
+    player/team, 0 for no extras/wicket). Each column is a plain .npy file, so
+    it can be opened with np.load(..., mmap_mode='r') without reading it.
+    Rows come from IPLNeo4jImporter.build_match_payload, so the snapshot uses
+    the same delivery and player-link definitions as the graph.
+    """
+
+    FORMAT_VERSION = 1
+
+    # Snapshot versions kept on disk; readers may still hold the previous one open
+    KEEP_VERSIONS = 2
+
+    MATCH_COLUMNS = {
+        'match_id': str,
+        'date': str,
+        'venue': np.int32,
+        'team1': np.int16,
+        'team2': np.int16,
+        'winner': np.int16,
+        'toss_winner': np.int16,
+    }
+
+    # One row per delivery, ordered by match (chronologically), innings, over and ball
+    DELIVERY_COLUMNS = {
+        'match': np.int32,         # row in the partition's match columns
+        'innings': np.int8,
+        'over': np.int8,           # 0-based, as in cricsheet
+        'ball': np.int8,           # position within the over, extras included
+        'batting_team': np.int16,
+        'bowling_team': np.int16,
+        'batter': np.int32,
+        'bowler': np.int32,
+        'non_striker': np.int32,
+        'runs_batter': np.int8,
+        'runs_extras': np.int8,
+        'runs_total': np.int8,
+        'extras_type': np.int8,
+        'wicket_kind': np.int8,
+        'player_out': np.int32,
+    }
+
+    def __init__(self, json_folder: str, output_dir: str):
+        """
+        Initialize the exporter.
+
+        Args:
+            json_folder: Path to folder containing IPL JSON files
+            output_dir: Directory holding the versioned snapshots
+        """
+        self.json_folder = Path(json_folder)
+        self.output_dir = Path(output_dir)
+
+    @staticmethod
+    def partition_name(season: str) -> str:
+        return "season=" + re.sub(r'[^0-9A-Za-z_-]', '_', season)
+
+    @classmethod
+    def snapshot_rows(cls, json_file: str) -> Dict[str, Any]:
+        """
+        Flatten one match file into a match record and raw delivery tuples.
+
+        Runs in the export process pool; ids are still strings here and are
+        dictionary-encoded by the parent process.
+        """
+        with open(json_file, 'rb') as f:
+            payload = IPLNeo4jImporter.build_match_payload(json.loads(f.read()), Path(json_file).stem)
+
+        links = {rel_type: {link['delivery_id']: link['player_id'] for link in payload['player_links'][rel_type]}
+                 for rel_type in ('FACED_BY', 'BOWLED_BY', 'NON_STRIKER', 'DISMISSED')}
+        teams = [team['name'] for team in payload['teams']]
+        innings = {inn['innings_id']: (inn['innings_number'], inn['batting_team']) for inn in payload['innings']}
+
+        deliveries = []
+        for delivery in payload['deliveries']:
+            props = delivery['props']
+            delivery_id = delivery['delivery_id']
+            innings_number, batting_team = innings[props['innings_id']]
+            bowling_team = next((team for team in teams if team != batting_team), None)
+            deliveries.append((
+                innings_number, props['over_number'], props['ball_in_over'], batting_team, bowling_team,
+                links['FACED_BY'].get(delivery_id), links['BOWLED_BY'].get(delivery_id),
+                links['NON_STRIKER'].get(delivery_id),
+                props['runs_batter'], props['runs_extras'], props['runs_total'],
+                props['extras_type'], props['wicket_kind'], links['DISMISSED'].get(delivery_id)
+            ))
+
+        return {
+            'match_id': payload['match_id'],
+            'season': payload['season'],
+            'date': payload['match']['date'],
+            'venue': (payload['venue'], payload['city']),
+            'teams': (teams + [None, None])[:2],
+            'winner': payload['winner'],
+            'toss_winner': payload['toss_winner'],
+            'players': [(player['id'], player['name']) for player in payload['players']],
+            'deliveries': deliveries,
+        }
+
+    def current_snapshot(self) -> tuple[Path, Dict[str, Any]]:
+        """The CURRENT snapshot directory and manifest, or (None, None) if there is no usable one."""
+        try:
+            version_dir = self.output_dir / (self.output_dir / 'CURRENT').read_text().strip()
+            with open(version_dir / 'manifest.json') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None, None
+        if manifest.get('format_version') != self.FORMAT_VERSION:
+            return None, None
+        return version_dir, manifest
+
+    def touched_partitions(self, pool: ProcessPoolExecutor, previous_dir: Path, manifest: Dict[str, Any],
+                           json_files: List[Path], match_ids: Set[str]) -> tuple[List[Dict[str, Any]], List[Dict]]:
+        """
+        Parse only the seasons an incremental run touched.
+
+        A season is touched when one of match_ids belongs to it now or did in
+        the previous snapshot, or when one of its previous matches no longer
+        has a file. Every remaining match of a touched season is re-parsed, so
+        its partition can be rewritten whole.
+
+        Returns:
+            The snapshot_rows records of the touched seasons in json_files
+            order, and the previous manifest entries of the untouched seasons
+        """
+        previous_ids = {entry['season']: set(np.load(previous_dir / entry['path'] / 'match_id.npy').tolist())
+                        for entry in manifest['seasons']}
+        changed_files = [str(f) for f in json_files if f.stem in match_ids]
+        parsed = {match['match_id']: match for match in pool.map(self.snapshot_rows, changed_files, chunksize=16)}
+
+        available = {f.stem for f in json_files}
+        touched = {match['season'] for match in parsed.values()}
+        touched.update(season for season, ids in previous_ids.items() if ids & match_ids or ids - available)
+        unchanged_files = [str(f) for f in json_files if f.stem not in parsed
+                           and any(f.stem in previous_ids.get(season, ()) for season in touched)]
+        for match in pool.map(self.snapshot_rows, unchanged_files, chunksize=16):
+            parsed[match['match_id']] = match
+
+        records = [parsed[f.stem] for f in json_files if f.stem in parsed]
+        linked = [entry for entry in manifest['seasons'] if entry['season'] not in touched]
+        return records, linked
+
+    def export(self, data_version: int, json_files: List[Path] = None, workers: int = None,
+               match_ids: List[str] = None) -> Path:
+        """
+        Write a complete snapshot for data_version and point CURRENT at it.
+
+        With match_ids (the matches written since the CURRENT snapshot), only
+        the season partitions holding them are rebuilt; the others are
+        hard-linked from CURRENT, whose dictionaries are extended rather than
+        rebuilt so their codes stay valid. An empty list links every partition
+        without parsing any JSON. Every file is parsed without match_ids, or
+        when CURRENT is missing or not the snapshot of data_version - 1 (a
+        snapshot was skipped or failed, so match_ids does not cover every
+        change since it).
+
+        The snapshot is assembled in a temporary directory and renamed into
+        place, so readers only ever see complete versions.
+
+        Returns:
+            The snapshot directory
+        """
+        json_files = json_files if json_files is not None else IPLNeo4jImporter.sort_match_files(self.json_folder)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        previous_dir, previous = self.current_snapshot() if match_ids is not None else (None, None)
+        if previous and previous['data_version'] != data_version - 1:
+            logger.info(f"Snapshot {previous_dir.name} is not the previous data version; rebuilding every season")
+            previous_dir, previous = None, None
+
+        players: Dict[str, int] = {}
+        player_names: List[str] = []
+        teams: Dict[str, int] = {}
+        venues: Dict[str, int] = {}
+        venue_cities: List[str] = []
+        extras_types: Dict[Any, int] = {None: 0}
+        wicket_kinds: Dict[Any, int] = {None: 0}
+        seasons: Dict[str, Dict[str, list]] = {}
+        linked: List[Dict[str, Any]] = []
+        if previous:
+            players = {player_id: i for i, player_id in enumerate(previous['players']['ids'])}
+            player_names = list(previous['players']['names'])
+            teams = {team: i for i, team in enumerate(previous['teams'])}
+            venues = {venue: i for i, venue in enumerate(previous['venues']['names'])}
+            venue_cities = list(previous['venues']['cities'])
+            extras_types = {value: i for i, value in enumerate(previous['extras_types'])}
+            wicket_kinds = {value: i for i, value in enumerate(previous['wicket_kinds'])}
+
+        def code(index: Dict[Any, int], key: Any) -> int:
+            if key is None and None not in index:
+                return -1
+            return index.setdefault(key, len(index))
+
+        parsed_count = 0
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+            if previous:
+                records, linked = self.touched_partitions(pool, previous_dir, previous, json_files, set(match_ids))
+            else:
+                records = pool.map(self.snapshot_rows, [str(f) for f in json_files], chunksize=16)
+            for match in records:
+                parsed_count += 1
+                # Player names keep their first (oldest) appearance, like the graph's ON CREATE SET
+                for player_id, name in match['players']:
+                    if player_id not in players:
+                        players[player_id] = len(player_names)
+                        player_names.append(name)
+                venue_name, city = match['venue']
+                if venue_name not in venues:
+                    venues[venue_name] = len(venue_cities)
+                    venue_cities.append(city)
+
+                partition = seasons.setdefault(match['season'], {
+                    name: [] for name in (*self.MATCH_COLUMNS, *self.DELIVERY_COLUMNS)
+                })
+                match_row = len(partition['match_id'])
+                for name, value in (
+                    ('match_id', match['match_id']),
+                    ('date', match['date']),
+                    ('venue', venues[venue_name]),
+                    ('team1', code(teams, match['teams'][0])),
+                    ('team2', code(teams, match['teams'][1])),
+                    ('winner', code(teams, match['winner'])),
+                    ('toss_winner', code(teams, match['toss_winner'])),
+                ):
+                    partition[name].append(value)
+
+                for (innings, over, ball, batting_team, bowling_team, batter, bowler, non_striker,
+                     runs_batter, runs_extras, runs_total, extras_type, wicket_kind,
+                     player_out) in match['deliveries']:
+                    for name, value in (
+                        ('match', match_row),
+                        ('innings', innings),
+                        ('over', over),
+                        ('ball', ball),
+                        ('batting_team', code(teams, batting_team)),
+                        ('bowling_team', code(teams, bowling_team)),
+                        ('batter', players.get(batter, -1)),
+                        ('bowler', players.get(bowler, -1)),
+                        ('non_striker', players.get(non_striker, -1)),
+                        ('runs_batter', runs_batter),
+                        ('runs_extras', runs_extras),
+                        ('runs_total', runs_total),
+                        ('extras_type', code(extras_types, extras_type)),
+                        ('wicket_kind', code(wicket_kinds, wicket_kind)),
+                        ('player_out', players.get(player_out, -1)),
+                    ):
+                        partition[name].append(value)
+
+        version_name = f"v{data_version}"
+        target = self.output_dir / version_name
+        staging = self.output_dir / f".{version_name}.tmp-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+
+        manifest_seasons = []
+        for season in sorted(seasons):
+            partition = seasons[season]
+            partition_dir = staging / self.partition_name(season)
+            partition_dir.mkdir(parents=True)
+            for name, dtype in {**self.MATCH_COLUMNS, **self.DELIVERY_COLUMNS}.items():
+                np.save(partition_dir / f"{name}.npy", np.array(partition[name], dtype=dtype))
+            manifest_seasons.append({
+                'season': season,
+                'path': self.partition_name(season),
+                'matches': len(partition['match_id']),
+                'deliveries': len(partition['match']),
+            })
+
+        # Untouched partitions share their files with the previous version
+        for entry in linked:
+            partition_dir = staging / entry['path']
+            partition_dir.mkdir(parents=True)
+            for source in (previous_dir / entry['path']).iterdir():
+                try:
+                    os.link(source, partition_dir / source.name)
+                except OSError:
+                    shutil.copy2(source, partition_dir / source.name)
+            manifest_seasons.append(entry)
+        manifest_seasons.sort(key=lambda entry: entry['season'])
+
+        manifest = {
+            'format_version': self.FORMAT_VERSION,
+            'data_version': data_version,
+            'created_at': datetime.now().isoformat(),
+            'match_columns': {name: np.dtype(dtype).str for name, dtype in self.MATCH_COLUMNS.items()
+                              if dtype is not str},
+            'delivery_columns': {name: np.dtype(dtype).str for name, dtype in self.DELIVERY_COLUMNS.items()},
+            'seasons': manifest_seasons,
+            'players': {'ids': list(players), 'names': player_names},
+            'teams': list(teams),
+            'venues': {'names': list(venues), 'cities': venue_cities},
+            'extras_types': list(extras_types),
+            'wicket_kinds': list(wicket_kinds),
+        }
+        with open(staging / 'manifest.json', 'w') as f:
+            json.dump(manifest, f)
+
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(staging, target)
+        current_tmp = self.output_dir / f".CURRENT.tmp-{os.getpid()}"
+        current_tmp.write_text(version_name)
+        os.replace(current_tmp, self.output_dir / 'CURRENT')
+        self.prune(keep=version_name)
+
+        total = sum(entry['deliveries'] for entry in manifest_seasons)
+        logger.info(f"✓ Wrote columnar snapshot {target}: {parsed_count} matches parsed, {len(seasons)} seasons "
+                    f"rewritten, {len(linked)} linked, {total} deliveries")
+        return target
+
+    def prune(self, keep: str):
+        """Remove all but the newest KEEP_VERSIONS snapshots (and always keep `keep`)."""
+        versions = sorted((p for p in self.output_dir.glob('v*') if p.is_dir() and p.name[1:].isdigit()),
+                          key=lambda p: int(p.name[1:]), reverse=True)
+        for path in versions[self.KEEP_VERSIONS:]:
+            if path.name != keep:
+                shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def read(snapshot_dir: str, mmap_mode: str = 'r') -> tuple[Dict[str, Any], Dict[str, Dict[str, np.ndarray]]]:
+        """
+        Open the CURRENT snapshot under snapshot_dir.
+
+        Returns:
+            The manifest and, per season, a dict of column name -> array
+            (memory-mapped unless mmap_mode is None)
+        """
+        root = Path(snapshot_dir)
+        version_dir = root / (root / 'CURRENT').read_text().strip()
+        with open(version_dir / 'manifest.json') as f:
+            manifest = json.load(f)
+        partitions = {
+            entry['season']: {path.stem: np.load(path, mmap_mode=mmap_mode)
+                              for path in (version_dir / entry['path']).glob('*.npy')}
+            for entry in manifest['seasons']
+        }
+        return manifest, partitions
+
+
+def parse_match_file(json_file: str) -> Dict[str, Any]:
+    """
+    Parse a cricsheet JSON file into a write payload.
+
+    Runs in a worker process of the parallel import pipeline, so it only
+    returns plain data: the payload, the unmapped JSON paths, or an error.
+    """
+    match_id = Path(json_file).stem
+    try:
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+        match_data = json.loads(raw)
+        source_hash = IPLNeo4jImporter.hash_match_file(raw)
+        return {
+            'match_id': match_id,
+            'payload': IPLNeo4jImporter.build_match_payload(match_data, match_id, source_hash),
+            'skipped_fields': IPLNeo4jImporter.find_unmapped_paths(match_data),
+            'error': None
+        }
+    except Exception as e:
+        return {'match_id': match_id, 'payload': None, 'skipped_fields': set(), 'error': str(e)}
+
 
 def main():
-    """Main execution function with smart skipping and once-a-day check."""
-    from datetime import date
-    
+    """Main execution function; the import manifest decides which matches need work."""
     # Load configuration from .env file
     NEO4J_URI = os.getenv("NEO4J_URI")
     NEO4J_USERNAME = os.getenv("NEO4J_USERNAME")
     NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
     JSON_FOLDER = os.getenv("JSON_FOLDER", "./data/ipl_json")
+    IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "10"))
+    IMPORT_PARSE_WORKERS = int(os.getenv("IMPORT_PARSE_WORKERS", "0")) or None
+    IMPORT_WRITER_THREADS = int(os.getenv("IMPORT_WRITER_THREADS", "4"))
+    SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", "")
     
-    # State check for smart skipping
-    state_file = ".importer_state.json"
-    today = date.today().isoformat()
+    parser = argparse.ArgumentParser(description="Import IPL JSON match data into Neo4j")
+    parser.add_argument("--bulk-export", metavar="DIR", nargs="?", const="./bulk_import",
+                        help="Write neo4j-admin import CSVs to DIR (default ./bulk_import) "
+                             "instead of importing into a running database")
+    parser.add_argument("--recompute-stats", action="store_true",
+                        help="Recompute derived stats for every match, not just newly imported ones")
+    args = parser.parse_args()
     
-    # Get current file count
-    try:
-        current_files = [f for f in os.listdir(JSON_FOLDER) if f.endswith(".json")]
-        current_count = len(current_files)
-    except Exception as e:
-        logger.error(f"Could not access JSON folder {JSON_FOLDER}: {e}")
+    if args.bulk_export:
+        exporter = BulkCSVExporter(json_folder=JSON_FOLDER, output_dir=args.bulk_export)
+        exporter.export()
+        problems = exporter.verify()
+        if problems:
+            for problem in problems:
+                logger.error(f"Export check failed: {problem}")
+            sys.exit(1)
+        logger.info("✓ Export matches the JSON corpus. Load it into a stopped, empty database with:")
+        logger.info(exporter.admin_import_command())
         return
-
-    # Check previous state
-    if os.path.exists(state_file):
-        try:
-            with open(state_file, 'r') as f:
-                state = json.load(f)
-                last_run_date = state.get("last_run_date")
-                last_file_count = state.get("last_file_count")
-                
-                # Rule 1: Don't run more than once a day
-                if last_run_date == today:
-                    logger.info(f"⏭️ Skipping: Importer already ran today ({today}).")
-                    return
-                
-                # Rule 2: Only run if files were added
-                if last_file_count == current_count:
-                    logger.info(f"⏭️ Skipping: No new files added since last run (Count: {current_count}).")
-                    return
-        except Exception as e:
-            logger.warning(f"⚠️ Could not read state file: {e}. Proceeding with check.")
-
+    
     # Create importer instance
     importer = IPLNeo4jImporter(
         uri=NEO4J_URI,
         username=NEO4J_USERNAME,
         password=NEO4J_PASSWORD,
-        json_folder=JSON_FOLDER
+        json_folder=JSON_FOLDER,
+        snapshot_dir=SNAPSHOT_DIR or None
     )
     
     try:
         # Import all matches
-        importer.import_all_matches(batch_size=10)
-        
-        # Save state after successful check/run
-        with open(state_file, 'w') as f:
-            json.dump({
-                "last_run_date": today,
-                "last_file_count": current_count
-            }, f)
-            
+        importer.import_all_matches(
+            batch_size=IMPORT_BATCH_SIZE,
+            parse_workers=IMPORT_PARSE_WORKERS,
+            writer_threads=IMPORT_WRITER_THREADS,
+            recompute_all_stats=args.recompute_stats
+        )
     except Exception as e:
         logger.error(f"❌ Importer failed: {e}")
     finally:
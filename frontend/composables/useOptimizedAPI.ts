@@ -4,7 +4,7 @@
  */
 
 import { ref, computed, type Ref, type ComputedRef } from 'vue'
-import { cacheAPI } from '~/utils/cache'
+import { cacheAPI, type FetchResult } from '~/utils/cache'
 import { usePerformanceMonitor } from '~/composables/usePerformance'
 
 interface APIOptions {
@@ -55,28 +55,38 @@ export function useOptimizedAPI() {
     const opts = { ...defaultOptions, ...options }
     const fullUrl = `${config.public.apiUrl || 'http://localhost:8000'}${endpoint}`
 
-    const fetchFn = async (): Promise<T> => {
+    // Conditional fetch: with a cached ETag the API answers 304 when nothing changed since the last import
+    const fetchFn = async (etag?: string): Promise<FetchResult<T>> => {
       const controller = new AbortController()
       const timeoutId = setTimeout(() => controller.abort(), opts.timeout!)
 
       try {
         return await trackAPI(endpoint, async () => {
+          const headers: Record<string, string> = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate, br'
+          }
+          if (etag) {
+            headers['If-None-Match'] = etag
+          }
+
           const response = await fetch(fullUrl, {
             signal: controller.signal,
-            headers: {
-              'Content-Type': 'application/json',
-              'Accept': 'application/json',
-              'Accept-Encoding': 'gzip, deflate, br'
-            }
+            headers
           })
 
           clearTimeout(timeoutId)
 
+          if (response.status === 304) {
+            return { notModified: true }
+          }
+
           if (!response.ok) {
             throw new Error(`HTTP ${response.status}: ${response.statusText}`)
           }
 
-          return await response.json()
+          return { data: await response.json(), etag: response.headers.get('ETag') }
         })
       } catch (error) {
         clearTimeout(timeoutId)
@@ -87,7 +97,7 @@ export function useOptimizedAPI() {
     if (opts.cache) {
       return await cacheAPI(endpoint, fetchFn, opts.cacheTTL!, opts.staleWhileRevalidate!)
     } else {
-      return await fetchFn()
+      return (await fetchFn()).data as T
     }
   }
 
@@ -16,8 +16,24 @@ export interface CacheItem<T> {
   expires: number;
   created: number;
   staleExpires?: number;
+  etag?: string; // Server ETag, sent back as If-None-Match to revalidate
 }
 
+/**
+ * Result of a (possibly conditional) fetch: fresh data with its ETag,
+ * or notModified when the server answered 304 to If-None-Match
+ */
+export interface FetchResult<T> {
+  data?: T;
+  etag?: string | null;
+  notModified?: boolean;
+}
+
+export type ConditionalFetch<T> = (etag?: string) => Promise<FetchResult<T>>;
+
+// Entries with an ETag are kept this long past expiry so they can be revalidated with a 304
+const REVALIDATE_RETENTION = 7 * 24 * 60 * 60 * 1000; // 7 days
+
 export class AdvancedCache {
   private static instance: AdvancedCache;
   private storage: Storage;
@@ -40,7 +56,7 @@ export class AdvancedCache {
   /**
    * Get data from cache with intelligent fallback
    */
-  async get<T>(config: CacheConfig, fetchFn: () => Promise<T>): Promise<T> {
+  async get<T>(config: CacheConfig, fetchFn: ConditionalFetch<T>): Promise<T> {
     const now = Date.now();
     
     // Try memory cache first (fastest)
@@ -60,28 +76,30 @@ export class AdvancedCache {
     }
 
     // Check for stale data that we can serve while revalidating
-    const staleData = this.getStaleData<T>(config.key, now);
-    if (staleData) {
+    const staleItem = this.getStaleItem<T>(config.key, now);
+    if (staleItem) {
       console.log(`⚡ Serving stale data for ${config.key} while revalidating...`);
       // Trigger background revalidation
-      this.backgroundRevalidate(config, fetchFn);
-      return staleData;
+      this.backgroundRevalidate(config, fetchFn, staleItem);
+      return staleItem.data;
     }
 
-    // No cache hit - fetch fresh data with retries
-    console.log(`🔄 Cache MISS for ${config.key} - fetching fresh data...`);
-    const data = await this.fetchWithRetry(fetchFn, config.retryAttempts || 3, config.retryDelay || 1000);
-    
-    // Cache the fresh data
-    this.set(config.key, data, config.ttl, config.staleWhileRevalidate);
+    // No usable cache entry - fetch with retries, revalidating an expired entry if we still have one
+    const expiredItem = this.memoryCache.get(config.key) || this.getFromStorage<T>(config.key);
+    console.log(`🔄 Cache MISS for ${config.key} - ${expiredItem?.etag ? 'revalidating' : 'fetching fresh data'}...`);
+    const result = await this.fetchWithRetry(
+      () => fetchFn(expiredItem?.etag),
+      config.retryAttempts || 3,
+      config.retryDelay || 1000
+    );
     
-    return data;
+    return this.store(config, result, expiredItem);
   }
 
   /**
    * Set data in cache
    */
-  set<T>(key: string, data: T, ttl: number, staleWhileRevalidate?: number): void {
+  set<T>(key: string, data: T, ttl: number, staleWhileRevalidate?: number, etag?: string): void {
     const now = Date.now();
     const expires = now + ttl;
     const staleExpires = staleWhileRevalidate ? expires + staleWhileRevalidate : expires;
@@ -90,7 +108,8 @@ export class AdvancedCache {
       data,
       expires,
       created: now,
-      staleExpires
+      staleExpires,
+      etag
     };
 
     // Set in memory cache
@@ -154,6 +173,20 @@ export class AdvancedCache {
 
   // Private methods
 
+  /**
+   * Cache a fetch result; a 304 renews the existing entry without re-downloading it
+   */
+  private store<T>(config: CacheConfig, result: FetchResult<T>, existing?: CacheItem<T> | null): T {
+    if (result.notModified && existing) {
+      console.log(`✅ ${config.key} not modified - cached copy renewed`);
+      this.set(config.key, existing.data, config.ttl, config.staleWhileRevalidate, existing.etag);
+      return existing.data;
+    }
+    
+    this.set(config.key, result.data as T, config.ttl, config.staleWhileRevalidate, result.etag || undefined);
+    return result.data as T;
+  }
+
   private getFromStorage<T>(key: string): CacheItem<T> | null {
     if (!this.storage) return null;
     
@@ -169,17 +202,17 @@ export class AdvancedCache {
     return null;
   }
 
-  private getStaleData<T>(key: string, now: number): T | null {
+  private getStaleItem<T>(key: string, now: number): CacheItem<T> | null {
     // Check memory first
     const memoryCached = this.memoryCache.get(key);
     if (memoryCached && memoryCached.staleExpires && now < memoryCached.staleExpires) {
-      return memoryCached.data;
+      return memoryCached;
     }
 
     // Check localStorage
     const localCached = this.getFromStorage<T>(key);
     if (localCached && localCached.staleExpires && now < localCached.staleExpires) {
-      return localCached.data;
+      return localCached;
     }
 
     return null;
@@ -195,10 +228,10 @@ export class AdvancedCache {
   }
 
   private async fetchWithRetry<T>(
-    fetchFn: () => Promise<T>, 
+    fetchFn: () => Promise<FetchResult<T>>, 
     attempts: number, 
     delay: number
-  ): Promise<T> {
+  ): Promise<FetchResult<T>> {
     for (let i = 0; i < attempts; i++) {
       try {
         return await fetchFn();
@@ -216,10 +249,14 @@ export class AdvancedCache {
     throw new Error('All retry attempts failed');
   }
 
-  private async backgroundRevalidate<T>(config: CacheConfig, fetchFn: () => Promise<T>): Promise<void> {
+  private async backgroundRevalidate<T>(
+    config: CacheConfig,
+    fetchFn: ConditionalFetch<T>,
+    staleItem: CacheItem<T>
+  ): Promise<void> {
     try {
-      const freshData = await fetchFn();
-      this.set(config.key, freshData, config.ttl, config.staleWhileRevalidate);
+      const result = await fetchFn(staleItem.etag);
+      this.store(config, result, staleItem);
       console.log(`✅ Background revalidation completed for ${config.key}`);
     } catch (error) {
       console.warn(`❌ Background revalidation failed for ${config.key}:`, error);
@@ -239,7 +276,7 @@ export class AdvancedCache {
     
     // Cleanup memory cache
     for (const [key, item] of this.memoryCache.entries()) {
-      if (now > (item.staleExpires || item.expires)) {
+      if (this.isDisposable(item, now)) {
         this.memoryCache.delete(key);
       }
     }
@@ -252,7 +289,7 @@ export class AdvancedCache {
       const key = this.storage.key(i);
       if (key && this.isCacheKey(key)) {
         const cached = this.getFromStorage(key);
-        if (cached && now > (cached.staleExpires || cached.expires)) {
+        if (cached && this.isDisposable(cached, now)) {
           keysToRemove.push(key);
         }
       }
@@ -265,6 +302,12 @@ export class AdvancedCache {
     }
   }
 
+  private isDisposable(item: CacheItem<any>, now: number): boolean {
+    const staleExpires = item.staleExpires || item.expires;
+    // Keep expired entries with an ETag around for cheap 304 revalidation
+    return now > (item.etag ? staleExpires + REVALIDATE_RETENTION : staleExpires);
+  }
+
   private clearOldestFromStorage(): void {
     if (!this.storage) return;
     
@@ -337,7 +380,7 @@ export const cache = AdvancedCache.getInstance();
 
 export const cacheAPI = async <T>(
   endpoint: string, 
-  fetchFn: () => Promise<T>,
+  fetchFn: ConditionalFetch<T>,
   ttl: number = 30 * 60 * 1000, // 30 minutes default
   staleWhileRevalidate: number = 60 * 60 * 1000 // 1 hour stale-while-revalidate
 ): Promise<T> => {
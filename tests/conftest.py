@@ -0,0 +1,28 @@
+"""Shared fixtures: a handful of bundled cricsheet matches, parsed once per session."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "backend")]
+
+from data_importer import IPLNeo4jImporter  # noqa: E402
+
+# Three seasons, two super-over matches (innings 3 and 4) and a franchise that was renamed
+MATCH_IDS = ["335982", "1082591", "1082592", "1082625", "1175365"]
+
+
+@pytest.fixture(scope="session")
+def matches():
+    """Raw match JSON by match id"""
+    folder = ROOT / "data" / "ipl_json"
+    return {match_id: json.loads((folder / f"{match_id}.json").read_text()) for match_id in MATCH_IDS}
+
+
+@pytest.fixture(scope="session")
+def payloads(matches):
+    """Importer payloads by match id, as written to Neo4j"""
+    return {match_id: IPLNeo4jImporter.build_match_payload(data, match_id) for match_id, data in matches.items()}
@@ -0,0 +1,160 @@
+"""DeliveryEngine results checked against totals computed straight from the match JSON."""
+
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+import analytics_engine
+from analytics_engine import DeliveryEngine, PHASES
+from data_importer import IPLNeo4jImporter
+
+TEAM_ALIASES = {"Royal Challengers Bangalore": "Royal Challengers Bengaluru"}
+
+
+def engine_inputs(payloads):
+    """The rows MATCHES_QUERY and DELIVERIES_QUERY return for these matches once imported"""
+    ordered = sorted(payloads.values(), key=lambda p: (p["season"], p["match"]["date"], p["match_id"]))
+    matches = [[p["match_id"], p["season"], p["venue"], [t["name"] for t in p["teams"]]] for p in ordered]
+    rows = []
+    for p in ordered:
+        names = {player["id"]: player["name"] for player in p["players"]}
+        innings = {inn["innings_id"]: inn for inn in p["innings"]}
+        links = {rel_type: {link["delivery_id"]: link["player_id"] for link in p["player_links"][rel_type]}
+                 for rel_type in ("FACED_BY", "BOWLED_BY")}
+        for delivery in p["deliveries"]:
+            props = delivery["props"]
+            batter = links["FACED_BY"].get(delivery["delivery_id"])
+            bowler = links["BOWLED_BY"].get(delivery["delivery_id"])
+            inn = innings[props["innings_id"]]
+            rows.append([p["match_id"], inn["innings_number"], props["over_number"], props["ball_in_over"],
+                         batter, names.get(batter), bowler, names.get(bowler), inn["batting_team"],
+                         props["runs_batter"], props["runs_extras"], props["wicket_kind"]])
+    return matches, rows
+
+
+def json_totals(matches, season=None, team=None, venue=None, phase=None):
+    """Per-player batting and bowling totals under the given filters, from the raw deliveries"""
+    totals = {"batting": defaultdict(lambda: {"runs": 0, "balls": 0, "matches": set()}),
+              "bowling": defaultdict(lambda: {"wickets": 0, "balls": 0, "runs_conceded": 0, "matches": set()})}
+    for match_id, data in matches.items():
+        info = data["info"]
+        registry = info["registry"]["people"]
+        if season is not None and IPLNeo4jImporter.normalize_season(info["season"]) != season:
+            continue
+        if venue is not None and info["venue"] != venue:
+            continue
+        for innings in data["innings"]:
+            batting_team = TEAM_ALIASES.get(innings["team"], innings["team"])
+            bowling_team = next(TEAM_ALIASES.get(t, t) for t in info["teams"] if t != innings["team"])
+            for over in innings["overs"]:
+                over_phase = "powerplay" if over["over"] < 6 else "middle" if over["over"] < 15 else "death"
+                if phase is not None and over_phase != phase:
+                    continue
+                for delivery in over["deliveries"]:
+                    if delivery["batter"] in registry and team in (None, batting_team):
+                        bat = totals["batting"][delivery["batter"]]
+                        bat["runs"] += delivery["runs"]["batter"]
+                        bat["balls"] += 1
+                        bat["matches"].add(match_id)
+                    if delivery["bowler"] in registry and team in (None, bowling_team):
+                        bowl = totals["bowling"][delivery["bowler"]]
+                        bowl["wickets"] += bool(delivery.get("wickets"))
+                        bowl["balls"] += 1
+                        bowl["runs_conceded"] += delivery["runs"]["total"]
+                        bowl["matches"].add(match_id)
+    for role_totals in totals.values():
+        for stats in role_totals.values():
+            stats["matches"] = len(stats["matches"])
+    return totals
+
+
+def assert_board(board, expected, primary, limit):
+    ranked = sorted((stats[primary] for stats in expected.values() if stats[primary] > 0), reverse=True)[:limit]
+    assert [row[primary] for row in board] == ranked
+    for row in board:
+        stats = expected[row["name"]]
+        assert row[primary] == stats[primary]
+        assert row["matches"] == stats["matches"]
+        if primary == "runs":
+            assert row["strike_rate"] == round(stats["runs"] * 100.0 / stats["balls"], 2)
+        else:
+            assert row["economy"] == round(stats["runs_conceded"] * 6.0 / stats["balls"], 2)
+
+
+@pytest.fixture(scope="module")
+def engine(payloads):
+    matches, rows = engine_inputs(payloads)
+    return DeliveryEngine.build(1, matches, rows, team_aliases=TEAM_ALIASES)
+
+
+FILTERS = [
+    {},
+    {"season": "2017"},
+    {"team": "Royal Challengers Bengaluru"},
+    {"venue": "Arun Jaitley Stadium"},
+    {"phase": "powerplay"},
+    {"phase": "middle"},
+    {"phase": "death"},
+    {"season": "2017", "phase": "death"},
+    {"team": "Mumbai Indians", "venue": "Saurashtra Cricket Association Stadium", "phase": "middle"},
+]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+@pytest.mark.parametrize("limit", [10, 1000])  # presorted table (or masked pass when combined), masked pass
+def test_leaderboards_match_json_totals(engine, matches, filters, limit):
+    expected = json_totals(matches, **filters)
+    assert_board(engine.top_batsmen(limit, **filters), expected["batting"], "runs", limit)
+    assert_board(engine.top_bowlers(limit, **filters), expected["bowling"], "wickets", limit)
+
+
+def test_unknown_filter_value_gives_empty_board(engine):
+    assert engine.top_batsmen(10, venue="Lord's") == []
+    assert engine.top_bowlers(10, team="Royal Challengers Bangalore") == []  # only the alias target is a team
+
+
+def test_phase_boundaries(engine):
+    over = engine.columns["over"]
+    expected = np.select([over < 6, over < 15], [0, 1], 2)
+    assert np.array_equal(engine.columns["phase"], expected)
+    assert [PHASES[engine.columns["phase"][np.argmax(over == o)]] for o in (5, 6, 14, 15)] == \
+        ["powerplay", "middle", "middle", "death"]
+
+
+def test_top_k_table_matches_masked_pass(payloads, monkeypatch):
+    """With a small K every single-filter board is read from the table, and must equal the masked pass"""
+    monkeypatch.setattr(analytics_engine, "LEADERBOARD_TOP_K", 5)
+    matches, rows = engine_inputs(payloads)
+    small = DeliveryEngine.build(1, matches, rows, team_aliases=TEAM_ALIASES)
+    for filters in [f for f in FILTERS if len(f) <= 1]:
+        for role in ("batting", "bowling"):
+            assert small.leaderboard(role, 5, **filters) == small.leaderboard(role, 6, **filters)[:5]
+
+
+def test_season_trends_match_json_totals(engine, matches):
+    runs, wickets = defaultdict(int), defaultdict(int)
+    for data in matches.values():
+        registry = data["info"]["registry"]["people"]
+        season = IPLNeo4jImporter.normalize_season(data["info"]["season"])
+        for innings in data["innings"]:
+            for over in innings["overs"]:
+                for delivery in over["deliveries"]:
+                    if delivery["batter"] in registry:
+                        runs[season] += delivery["runs"]["batter"]
+                    if delivery["bowler"] in registry and delivery.get("wickets"):
+                        wickets[season] += 1
+    assert engine.runs_by_season() == [{"season": s, "total_runs": runs[s]} for s in sorted(runs)]
+    assert engine.wickets_by_season() == [{"season": s, "total_wickets": wickets[s]} for s in sorted(wickets)]
+
+
+def test_analytics_file_round_trip(engine, tmp_path):
+    path = str(tmp_path / "analytics.bin")
+    engine.save(path)
+    mapped = DeliveryEngine.open(path)
+    assert mapped.source == "mmap"
+    assert mapped.stats()["deliveries"] == engine.size
+    for filters in FILTERS:
+        assert mapped.top_batsmen(20, **filters) == engine.top_batsmen(20, **filters)
+        assert mapped.top_bowlers(20, **filters) == engine.top_bowlers(20, **filters)
+    assert mapped.runs_by_season() == engine.runs_by_season()
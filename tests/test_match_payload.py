@@ -0,0 +1,59 @@
+"""Per-match player stats in the import payload checked against the match JSON."""
+
+from collections import Counter, defaultdict
+
+FIELDING_CREDITS = {"caught": "catches", "caught and bowled": "catches", "stumped": "stumpings",
+                    "run out": "run_outs"}
+
+
+def json_player_stats(data):
+    registry = data["info"]["registry"]["people"]
+    batting = defaultdict(Counter)
+    bowling = defaultdict(Counter)
+    fielding = defaultdict(Counter)
+    for innings in data["innings"]:
+        for over in innings["overs"]:
+            for delivery in over["deliveries"]:
+                runs = delivery["runs"]
+                wickets = delivery.get("wickets", [])
+                bat = batting[registry[delivery["batter"]]]
+                bat["runs"] += runs["batter"]
+                bat["balls"] += 1
+                bat["fours"] += runs["batter"] == 4
+                bat["sixes"] += runs["batter"] == 6
+                bowl = bowling[registry[delivery["bowler"]]]
+                bowl["balls"] += 1
+                bowl["runs_conceded"] += runs["total"]
+                bowl["wickets"] += bool(wickets)
+                if not wickets:
+                    continue
+                kind = wickets[0]["kind"]
+                if wickets[0]["player_out"] == delivery["batter"]:
+                    bat["out"] = 1
+                credited = [delivery["bowler"]] if kind == "caught and bowled" else \
+                    [fielder["name"] for fielder in wickets[0].get("fielders", []) if "name" in fielder]
+                for name in credited if kind in FIELDING_CREDITS else []:
+                    fielding[registry[name]][FIELDING_CREDITS[kind]] += 1
+    return batting, bowling, fielding
+
+
+def test_player_stats_match_json(matches, payloads):
+    for match_id, data in matches.items():
+        payload = payloads[match_id]
+        batting, bowling, fielding = json_player_stats(data)
+        rows = {rel_type: {row["player_id"]: row["props"] for row in payload[rel_type]}
+                for rel_type in ("batting_stats", "bowling_stats", "fielding_stats")}
+
+        assert rows["batting_stats"].keys() == batting.keys()
+        for player_id, props in rows["batting_stats"].items():
+            assert {key: props[key] for key in ("runs", "balls", "fours", "sixes")} == \
+                {key: batting[player_id][key] for key in ("runs", "balls", "fours", "sixes")}
+            assert props["out"] == bool(batting[player_id]["out"])
+
+        assert rows["bowling_stats"].keys() == bowling.keys()
+        for player_id, props in rows["bowling_stats"].items():
+            assert {key: props[key] for key in ("balls", "runs_conceded", "wickets")} == dict(bowling[player_id])
+
+        assert rows["fielding_stats"].keys() == fielding.keys()
+        for player_id, props in rows["fielding_stats"].items():
+            assert {key: value for key, value in props.items() if value} == dict(fielding[player_id])
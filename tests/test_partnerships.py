@@ -0,0 +1,40 @@
+"""Partnership segmentation, on hand-built deliveries and on the bundled matches."""
+
+from data_importer import IPLNeo4jImporter
+
+
+def ball(batter, non_striker, runs=0, over=0, wide=False, wicket=None):
+    return {"batter_id": batter, "non_striker_id": non_striker, "over_number": over,
+            "runs_total": runs, "is_wide": wide, "wicket_kind": wicket}
+
+
+def test_segment_partnerships_splits_on_wickets_and_pair_changes():
+    balls = [
+        ball("b", "a", runs=4),
+        ball("a", "b", runs=1, wide=True),
+        ball("a", "b", wicket="caught"),
+        ball("c", "b", runs=6, over=1),
+        ball("b", "c", over=1, wicket="retired hurt"),
+        ball("c", "d", runs=2, over=2),
+        ball(None, "d", runs=1, over=2),  # unlinked batter: skipped
+        ball("e", "c", runs=1, over=3),  # new pair without a wicket ball in between
+    ]
+    partnerships = IPLNeo4jImporter.segment_partnerships("m", "m_innings_1", balls)
+    assert [(p["player1_id"], p["player2_id"]) for p in partnerships] == [("a", "b"), ("b", "c"), ("c", "d"), ("c", "e")]
+    assert [p["props"]["partnership_number"] for p in partnerships] == [1, 2, 3, 4]
+    assert [p["props"]["runs"] for p in partnerships] == [5, 6, 2, 1]
+    assert [p["props"]["balls"] for p in partnerships] == [2, 2, 1, 1]
+    assert [p["props"]["wicket_ended"] for p in partnerships] == [True, False, False, False]
+    assert [(p["props"]["from_over"], p["props"]["to_over"]) for p in partnerships] == [(0, 0), (1, 1), (2, 2), (3, 3)]
+
+
+def test_payload_partnerships_cover_each_innings(matches, payloads):
+    for match_id, data in matches.items():
+        payload = payloads[match_id]
+        for innings, inn_payload in zip(data["innings"], payload["innings"]):
+            deliveries = [d for over in innings["overs"] for d in over["deliveries"]]
+            # Every delivery has both batters registered, so partnerships cover the whole innings
+            partnerships = [p for p in payload["partnerships"] if p["props"]["innings_id"] == inn_payload["innings_id"]]
+            assert sum(p["props"]["runs"] for p in partnerships) == sum(d["runs"]["total"] for d in deliveries)
+            assert sum(p["props"]["balls"] for p in partnerships) == \
+                sum(1 for d in deliveries if "wides" not in d.get("extras", {}))
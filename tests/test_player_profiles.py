@@ -0,0 +1,80 @@
+"""Player profile documents checked against the match JSON."""
+
+from collections import defaultdict
+
+from data_importer import IPLNeo4jImporter
+
+
+def profile_inputs(payloads, player_id):
+    """The BATTING_STATS, BOWLING_STATS and SELECTED_PLAYER rows refresh_player_profiles reads for a player"""
+    batting, bowling, teams = [], [], []
+    for payload in payloads.values():
+        match = {"match_id": payload["match_id"], "date": payload["match"]["date"], "season": payload["season"]}
+        for row in payload["batting_stats"]:
+            if row["player_id"] == player_id:
+                props = row["props"]
+                batting.append({**match, "runs": props["runs"], "balls": props["balls"], "fours": props["fours"],
+                                "sixes": props["sixes"], "out": props["out"]})
+        for row in payload["bowling_stats"]:
+            if row["player_id"] == player_id:
+                props = row["props"]
+                bowling.append({**match, "wickets": props["wickets"], "runs": props["runs_conceded"],
+                                "balls": props["balls"]})
+        teams.extend({"team": squad["team"], "season": payload["season"], "match_id": payload["match_id"]}
+                     for squad in payload["squad"] if squad["player_id"] == player_id)
+    return batting, bowling, teams
+
+
+def test_player_profiles_match_json(matches, payloads):
+    expected = defaultdict(lambda: {
+        "runs": defaultdict(int), "balls": 0, "fours": 0, "outs": set(), "wickets": defaultdict(int),
+        "bowled": 0, "conceded": 0, "matches": set(), "teams": {}})
+    for match_id in sorted(matches, key=lambda m: (len(m), m)):
+        info = matches[match_id]["info"]
+        registry = info["registry"]["people"]
+        season = IPLNeo4jImporter.normalize_season(info["season"])
+        for team, squad in info["players"].items():
+            for name in squad:
+                expected[registry[name]]["teams"][season] = team
+        for innings in matches[match_id]["innings"]:
+            for over in innings["overs"]:
+                for delivery in over["deliveries"]:
+                    batter = expected[registry[delivery["batter"]]]
+                    batter["runs"][match_id] += delivery["runs"]["batter"]
+                    batter["balls"] += 1
+                    batter["fours"] += delivery["runs"]["batter"] == 4
+                    batter["matches"].add(match_id)
+                    wickets = delivery.get("wickets", [])
+                    # BATTING_STATS.out only records the striker's own dismissal
+                    if wickets and wickets[0].get("player_out") == delivery["batter"]:
+                        batter["outs"].add(match_id)
+                    bowler = expected[registry[delivery["bowler"]]]
+                    bowler["wickets"][match_id] += bool(wickets)
+                    bowler["bowled"] += 1
+                    bowler["conceded"] += delivery["runs"]["total"]
+                    bowler["matches"].add(match_id)
+
+    players = {player["id"]: player["name"] for payload in payloads.values() for player in payload["players"]}
+    assert {pid for pid, stats in expected.items() if stats["matches"]} <= set(players)
+    for player_id, stats in expected.items():
+        profile = IPLNeo4jImporter.build_player_profile(player_id, players[player_id],
+                                                        *profile_inputs(payloads, player_id))
+        runs = stats["runs"]
+        assert profile["matches"] == len(stats["matches"])
+        assert profile["batting"]["runs"] == sum(runs.values())
+        assert profile["batting"]["balls"] == stats["balls"]
+        assert profile["batting"]["fours"] == stats["fours"]
+        assert profile["batting"]["innings"] == len(runs)
+        assert profile["batting"]["highest"] == max(runs.values(), default=0)
+        assert profile["batting"]["outs"] == len(stats["outs"])
+        assert profile["bowling"]["wickets"] == sum(stats["wickets"].values())
+        assert profile["bowling"]["best"] == max(stats["wickets"].values(), default=0)
+        assert profile["bowling"]["innings"] == len(stats["wickets"])
+        assert profile["bowling"]["balls"] == stats["bowled"]
+        assert profile["bowling"]["runs"] == stats["conceded"]
+        assert profile["team_history"] == stats["teams"]
+        assert profile["slug"] == IPLNeo4jImporter.player_slug(players[player_id])
+        dates = [(m["date"], m["match_id"]) for m in profile["recent_form"]]
+        assert dates == sorted(dates, reverse=True)
+        assert sum(season["batting"]["runs"] for season in profile["seasons"].values()) == profile["batting"]["runs"]
+
@@ -0,0 +1,267 @@
+"""The API's response cache, exercised in memory: no Neo4j, SQLite file or Redis."""
+
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+# Read when backend_api is imported: keep every tier but L1 out of the tests
+os.environ.update(CACHE_DISK_PATH="", ANALYTICS_DIR="", ENABLE_REDIS="false")
+
+import backend_api  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def connected(monkeypatch):
+    """A connected-looking database (so results are stored) and an empty memory tier"""
+    monkeypatch.setattr(backend_api.db, "driver", object())
+    backend_api.memory_cache.clear()
+    yield
+    backend_api.memory_cache.clear()
+    backend_api._inflight.clear()
+
+
+@pytest.fixture
+def seasons(monkeypatch):
+    """/api/seasons answered by a stub query; returns the list of queries run"""
+    queries = []
+
+    async def query(cypher, params=None):
+        queries.append(cypher)
+        return [{"season": str(year), "matches": 60} for year in range(2025, 1950, -1)]
+    monkeypatch.setattr(backend_api.db, "query", query)
+    return queries
+
+
+def get(path, headers=None):
+    async def main():
+        transport = httpx.ASGITransport(app=backend_api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers=headers)
+    return asyncio.run(main())
+
+
+def counting(result=None, delay=0.01):
+    """An async function returning `result` (default: which call this is), and its list of calls"""
+    calls = []
+
+    async def func(*args, **kwargs):
+        calls.append((args, kwargs))
+        number = len(calls)
+        await asyncio.sleep(delay)
+        return number if result is None else result
+    return func, calls
+
+
+def test_single_flight_shares_one_computation_per_key():
+    compute, calls = counting()
+
+    async def main():
+        return await asyncio.gather(*(backend_api.single_flight("a", compute) for _ in range(5)),
+                                    backend_api.single_flight("b", compute))
+
+    assert asyncio.run(main()) == [1, 1, 1, 1, 1, 2]
+    assert len(calls) == 2
+    assert not backend_api._inflight
+
+
+def test_single_flight_survives_a_cancelled_caller():
+    compute, calls = counting()
+
+    async def main():
+        first = asyncio.ensure_future(backend_api.single_flight("a", compute))
+        second = backend_api.single_flight("a", compute)
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 1
+    assert len(calls) == 1
+
+
+def test_concurrent_misses_call_the_endpoint_once():
+    func, calls = counting(result={"rows": [1, 2, 3]})
+    cached = backend_api.cache_response(ttl=60)(func)
+
+    async def main():
+        return await asyncio.gather(*(cached() for _ in range(5)), cached(), cached())
+
+    assert asyncio.run(main()) == [{"rows": [1, 2, 3]}] * 7
+    assert len(calls) == 1
+
+
+def cached_entry():
+    (entry,) = backend_api.memory_cache.values()
+    return entry
+
+
+async def settled(coroutine):
+    """Await a call, then let any background refresh it scheduled finish"""
+    result = await coroutine
+    while backend_api._inflight:
+        await asyncio.sleep(0.005)
+    return result
+
+
+def test_stale_entry_is_served_while_it_is_recomputed():
+    func, calls = counting()
+    cached = backend_api.cache_response(ttl=60)(func)
+
+    async def main():
+        assert await cached() == 1
+        cached_entry()["fresh_until"] = time.time() - 1
+        stale_hits = backend_api.cache_metrics["stale_hits"]
+        assert await settled(cached()) == 1  # answered from the stale entry...
+        assert backend_api.cache_metrics["stale_hits"] == stale_hits + 1
+        assert await cached() == 2  # ...which the background refresh replaced
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("hits, remaining, refreshed", [
+    (backend_api.REFRESH_AHEAD_MIN_HITS - 1, 3, True),  # hot and in the last 10% of its TTL
+    (backend_api.REFRESH_AHEAD_MIN_HITS - 2, 3, False),  # in the window, but not hot enough
+    (backend_api.REFRESH_AHEAD_MIN_HITS - 1, 30, False),  # hot, but well within its TTL
+])
+def test_refresh_ahead_only_for_hot_entries_near_expiry(hits, remaining, refreshed):
+    func, calls = counting()
+    cached = backend_api.cache_response(ttl=60)(func)
+
+    async def main():
+        await cached()
+        entry = cached_entry()
+        entry["hits"] = hits
+        entry["fresh_until"] = time.time() + remaining
+        assert await settled(cached()) == 1
+        return backend_api.entry_value(cached_entry())
+
+    assert asyncio.run(main()) == (2 if refreshed else 1)
+    assert len(calls) == (2 if refreshed else 1)
+
+
+def test_a_new_data_version_misses_the_cache(monkeypatch):
+    func, calls = counting()
+    cached = backend_api.cache_response(ttl=60)(func)
+
+    async def main():
+        before = await cached()
+        monkeypatch.setattr(backend_api.db, "data_version", backend_api.db.data_version + 1)
+        return before, await cached(), await cached()
+
+    assert asyncio.run(main()) == (1, 2, 2)
+
+
+@pytest.mark.parametrize("value, tag", [
+    ({"season": "2017", "runs": [1, 2, 3], "rate": 7.5, "winner": None}, b"j"),
+    ([{"player": f"Player {n}", "runs": n} for n in range(2000)], b"z"),  # over CACHE_COMPRESS_THRESHOLD
+])
+def test_plain_values_round_trip(value, tag):
+    data = backend_api.encode_cache_value(value)
+    assert data[:1] == tag
+    assert backend_api.decode_cache_value(data) == value
+
+
+def test_encoding_dumps_models_and_stringifies_keys():
+    value = {"stats": backend_api.SeasonStats(season="2017", matches=59), 2017: "season"}
+    assert backend_api.decode_cache_value(backend_api.encode_cache_value(value)) == \
+        {"stats": {"season": "2017", "matches": 59}, "2017": "season"}
+
+
+def test_untagged_json_still_decodes():
+    assert backend_api.decode_cache_value(b'{"runs": 1}') == {"runs": 1}
+
+
+def test_disk_tier_promotes_hits_into_memory(monkeypatch, tmp_path):
+    disk = backend_api.DiskCache(str(tmp_path / "responses.sqlite"))
+    monkeypatch.setattr(backend_api, "disk_cache", disk)
+
+    async def main():
+        await backend_api.set_cache("live", {"runs": 1}, ttl=60)
+        disk.set("expired", backend_api.encode_cache_value({"value": 0, "fresh_until": 0, "stale_until": 1}), 1)
+        backend_api.memory_cache.clear()  # as after a worker restart
+        return await backend_api.get_many_from_cache(["live", "expired", "absent"])
+
+    assert asyncio.run(main()) == {"live": {"runs": 1}}
+    assert "live" in backend_api.memory_cache
+    assert disk.stats()["entries"] == 1
+
+
+def test_direct_and_spelled_out_calls_share_an_entry():
+    """The cache warmer calls endpoints with defaults; FastAPI passes every parameter by name"""
+    calls = []
+
+    @backend_api.cache_response(ttl=60)
+    async def top_batsmen(limit: int = 10, season: str = None):
+        calls.append((limit, season))
+        return [limit, season]
+
+    async def main():
+        return [await top_batsmen(), await top_batsmen(10), await top_batsmen(limit=10, season=None),
+                await top_batsmen(season="2017")]
+
+    assert asyncio.run(main()) == [[10, None]] * 3 + [[10, "2017"]]
+    assert calls == [(10, None), (10, "2017")]
+
+
+@pytest.mark.parametrize("count", [1, 75])  # body only, and body with a gzip variant
+def test_rendered_entries_round_trip(count):
+    seasons = [backend_api.SeasonStats(season=str(2025 - n), matches=60) for n in range(count)]
+    entry = backend_api.render_entry(backend_api.get_seasons, seasons, 60, 60)
+    assert ("gzip" in entry) == (count > 1)
+    data = backend_api.encode_cache_value(entry)
+    assert data[:1] == b"r"
+    assert backend_api.decode_cache_value(data) == entry
+
+
+def test_cached_response_is_sent_precompressed(seasons):
+    first = get("/api/seasons", {"Accept-Encoding": "gzip"})
+    second = get("/api/seasons", {"Accept-Encoding": "gzip"})
+    plain = get("/api/seasons", {"Accept-Encoding": "identity"})
+    assert len(seasons) == 1
+    assert first.headers["content-encoding"] == second.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert first.json() == second.json() == plain.json()
+    assert plain.json()[0] == {"season": "2025", "matches": 60}
+    entry = cached_entry()
+    assert int(second.headers["content-length"]) == len(entry["gzip"]) < len(entry["body"])
+
+
+def test_matching_etag_is_answered_without_the_endpoint(seasons, monkeypatch):
+    first = get("/api/seasons")
+    etag = first.headers["etag"]
+    assert etag.startswith(f'W/"v{backend_api.db.data_version}-')
+    assert first.headers["cache-control"].startswith("public, max-age=600")
+    backend_api.memory_cache.clear()
+
+    for if_none_match in (etag, etag.removeprefix("W/"), f'W/"v0-other", {etag}', "*"):
+        revalidated = get("/api/seasons", {"If-None-Match": if_none_match})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+        assert revalidated.content == b""
+    assert len(seasons) == 1
+
+    monkeypatch.setattr(backend_api.db, "data_version", backend_api.db.data_version + 1)
+    changed = get("/api/seasons", {"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(seasons) == 2
+
+
+def test_degraded_entries_are_sent_no_store_and_not_cached(monkeypatch):
+    queries = []
+
+    async def failing_query(cypher, params=None):
+        queries.append(cypher)
+        raise RuntimeError("Neo4j unavailable")
+    monkeypatch.setattr(backend_api.db, "query", failing_query)
+
+    for _ in range(2):
+        response = get("/api/players/virat-kohli/stats")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-store"
+        assert "etag" not in response.headers
+    assert len(queries) == 2
+    assert not backend_api.memory_cache
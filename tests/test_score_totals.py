@@ -0,0 +1,36 @@
+"""Innings and Over totals in the import payload, checked against the match JSON."""
+
+
+def is_dismissal(delivery):
+    wickets = delivery.get("wickets")
+    return bool(wickets) and wickets[0]["kind"] != "retired hurt"
+
+
+def test_innings_totals_match_json(matches, payloads):
+    for match_id, data in matches.items():
+        payload = payloads[match_id]
+        assert len(payload["innings"]) == len(data["innings"])
+        for innings, inn_payload in zip(data["innings"], payload["innings"]):
+            deliveries = [d for over in innings["overs"] for d in over["deliveries"]]
+            legal = sum(1 for d in deliveries if not {"wides", "noballs"} & set(d.get("extras", {})))
+            props = inn_payload["props"]
+            assert props["total_runs"] == sum(d["runs"]["total"] for d in deliveries)
+            assert props["total_wickets"] == sum(map(is_dismissal, deliveries))
+            assert props["extras"] == sum(d["runs"]["extras"] for d in deliveries)
+            assert props["legal_balls"] == legal
+            assert props["overs_bowled"] == legal // 6 + (legal % 6) / 10.0
+
+
+def test_over_totals_are_cumulative(matches, payloads):
+    for match_id, data in matches.items():
+        overs = {over["over_id"]: over["props"] for over in payloads[match_id]["overs"]}
+        for innings_number, innings in enumerate(data["innings"], 1):
+            cumulative_runs = cumulative_wickets = 0
+            for over in innings["overs"]:
+                props = overs[f"{match_id}_innings_{innings_number}_over_{over['over']}"]
+                runs = sum(d["runs"]["total"] for d in over["deliveries"])
+                wickets = sum(map(is_dismissal, over["deliveries"]))
+                cumulative_runs += runs
+                cumulative_wickets += wickets
+                assert (props["runs"], props["wickets"]) == (runs, wickets)
+                assert (props["cumulative_runs"], props["cumulative_wickets"]) == (cumulative_runs, cumulative_wickets)